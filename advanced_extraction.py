@@ -8,38 +8,168 @@ data from various sources, enhancing the basic extraction capabilities.
 import re
 import nltk
 import string
+from bisect import bisect_right
 from datetime import datetime
-from nltk.tokenize import word_tokenize, sent_tokenize
+from functools import lru_cache
+from nltk.tokenize import PunktTokenizer, word_tokenize
 from nltk.corpus import stopwords
 
+try:
+    import re2 as _fast_re
+except ImportError:  # Optional linear-time engine, fall back to re
+    _fast_re = re
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator, fall back to re
+    hyperscan = None
+
 # Download necessary NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
+    nltk.data.find('tokenizers/punkt_tab')
 except LookupError:
-    nltk.download('punkt')
+    nltk.download('punkt_tab')
 
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
     nltk.download('stopwords')
 
+# Pre-compiled patterns shared by the extractors; the scanning patterns use
+# no backreferences or lookarounds so they can run on RE2 when installed
+_EMAIL_RE = _fast_re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PERSONAL_PREFIX_RE = _fast_re.compile(r'[a-zA-Z]+\.[a-zA-Z]+')
+_PUNCT_TRANSLATE = str.maketrans('', '', string.punctuation)
+_GENERIC_PREFIXES = frozenset({'info', 'contact', 'admin', 'sales', 'support', 'hello', 'office'})
+# Translation table deleting every non-digit character the phone patterns can
+# match (Latin-1 punctuation/letters plus Unicode whitespace)
+_NONDIGIT_DELETE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(0x3001))
+    if ch not in string.digits and (ch <= '\xff' or ch.isspace())
+))
+# Phone numbers, longest form first: +1 (123) 456-7890, (123) 456-7890,
+# 123-456-7890, then bare 456-7890
+_PHONE_RE = _fast_re.compile(
+    r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    r'|\b\d{3}[-.\s]?\d{4}\b'
+)
+
+def _is_title_word(word):
+    """Check if a word is a capital ASCII letter followed by lowercase letters."""
+    rest = word[1:]
+    return ('A' <= word[:1] <= 'Z' and rest.isascii() and rest.isalpha()
+            and rest.islower())
+
+
+# Cheap sentence boundary: terminal punctuation, whitespace, then a capital
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+_punkt_tokenizer = None
+
+
+def fast_sent_spans(text):
+    """Split text into sentence spans with a regex instead of Punkt.
+    
+    Much faster than NLTK on long pages, at the cost of some precision
+    around abbreviations, which is fine for the section matching done here.
+    
+    Args:
+        text (str): Text to split
+        
+    Yields:
+        tuple: (start, end) offsets of each sentence
+    """
+    start = 0
+    for match in _SENT_SPLIT.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
+
+
+# The extractors call preprocess on the same document one after another, so a
+# few entries are enough and the cache never holds more than a few texts
+@lru_cache(maxsize=4)
+def preprocess(text, fast=False):
+    """Split text into sentences once so all extractors can share the result.
+    
+    Args:
+        text (str): Text to split
+        fast (bool): Use the regex splitter instead of NLTK Punkt
+        
+    Returns:
+        tuple: (sentences, lowercased sentences, sentence (start, end) spans)
+    """
+    if fast:
+        spans = tuple(fast_sent_spans(text))
+    else:
+        global _punkt_tokenizer
+        if _punkt_tokenizer is None:
+            _punkt_tokenizer = PunktTokenizer('english')
+        spans = tuple(_punkt_tokenizer.span_tokenize(text))
+    sentences = tuple(text[start:end] for start, end in spans)
+    return sentences, tuple(s.lower() for s in sentences), spans
+
+
+class MultiPatternMatcher:
+    """Tests text against several patterns in a single scan.
+    
+    Uses a Hyperscan database when the hyperscan package is installed and a
+    compiled re alternation otherwise.
+    """
+    
+    def __init__(self, patterns):
+        """Initialize the matcher.
+        
+        Args:
+            patterns (list): Regular expressions to match
+        """
+        self.patterns = list(patterns)
+        self._re = re.compile('|'.join(self.patterns))
+        self._db = None
+        
+        if hyperscan is not None:
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=[p.encode('utf-8') for p in self.patterns],
+                ids=list(range(len(self.patterns))),
+                elements=len(self.patterns),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(self.patterns)
+            )
+    
+    def search(self, text):
+        """Check whether any pattern occurs in text.
+        
+        Args:
+            text (str): Text to scan
+            
+        Returns:
+            bool: True if at least one pattern matches, False otherwise
+        """
+        if self._db is None:
+            return self._re.search(text) is not None
+        
+        found = []
+        self._db.scan(text.encode('utf-8'), match_event_handler=lambda *args: found.append(args[0]))
+        return bool(found)
+
+
 class ContactExtractor:
     """Advanced contact information extractor."""
     
-    def __init__(self):
-        """Initialize the contact extractor."""
+    def __init__(self, fast_sentences=False):
+        """Initialize the contact extractor.
+        
+        Args:
+            fast_sentences (bool): Split sentences with a regex instead of NLTK Punkt
+        """
+        self.fast_sentences = fast_sentences
+        
         # Common email domains for business emails
-        self.business_domains = [
+        self.business_domains = frozenset([
             'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
             'icloud.com', 'protonmail.com', 'mail.com', 'zoho.com'
-        ]
-        
-        # Patterns for different phone number formats
-        self.phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890, 123-456-7890
-            r'\d{3}[-.\s]?\d{4}',  # 456-7890
-            r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # +1 (123) 456-7890
-        ]
+        ])
         
         # Patterns for contact information sections
         self.contact_section_patterns = [
@@ -50,6 +180,7 @@ class ContactExtractor:
             r'inquiries',
             r'questions'
         ]
+        self._contact_section_matcher = MultiPatternMatcher(self.contact_section_patterns)
     
     def extract_emails(self, text):
         """Extract email addresses from text with advanced filtering.
@@ -63,28 +194,38 @@ class ContactExtractor:
         if not text:
             return []
         
-        # Regular expression for email extraction
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, text)
+        return self._score_emails(_EMAIL_RE.findall(text))
+    
+    def _score_emails(self, emails):
+        """Score emails and sort them by quality.
         
-        # Score and filter emails
+        Args:
+            emails (list): Email addresses
+            
+        Returns:
+            list: Email dicts with quality scores, highest first
+        """
         scored_emails = []
         for email in emails:
-            score = self._score_email(email)
+            # Split once and share the parts between the checks
+            prefix, _, domain = email.partition('@')
+            prefix = prefix.lower()
+            domain = domain.lower()
             scored_emails.append({
                 'email': email,
-                'score': score,
-                'is_business': self._is_business_email(email)
+                'score': self._score_email(prefix, domain),
+                'is_business': self._is_business_email(domain)
             })
         
         # Sort by score (highest first)
         return sorted(scored_emails, key=lambda x: x['score'], reverse=True)
     
-    def _score_email(self, email):
+    def _score_email(self, prefix, domain):
         """Score an email based on its quality as a lead contact.
         
         Args:
-            email (str): Email address
+            prefix (str): Lowercased local part of the email address
+            domain (str): Lowercased domain of the email address
             
         Returns:
             float: Quality score (0.0-1.0)
@@ -92,34 +233,29 @@ class ContactExtractor:
         score = 0.5  # Start with neutral score
         
         # Check for generic prefixes (lower score)
-        generic_prefixes = ['info', 'contact', 'admin', 'sales', 'support', 'hello', 'office']
-        prefix = email.split('@')[0].lower()
-        
-        if prefix in generic_prefixes:
+        if prefix in _GENERIC_PREFIXES:
             score -= 0.2
         
         # Check for personal-looking emails (higher score)
-        if re.match(r'^[a-zA-Z]+\.[a-zA-Z]+@', email):  # first.last@ pattern
+        if _PERSONAL_PREFIX_RE.fullmatch(prefix):  # first.last@ pattern
             score += 0.3
         
         # Check domain
-        domain = email.split('@')[-1].lower()
         if domain not in self.business_domains:  # Not a common personal email domain
             score += 0.2
         
         # Cap at range 0.0-1.0
         return max(0.0, min(1.0, score))
     
-    def _is_business_email(self, email):
+    def _is_business_email(self, domain):
         """Check if an email is likely a business email.
         
         Args:
-            email (str): Email address
+            domain (str): Lowercased domain of the email address
             
         Returns:
             bool: True if likely a business email, False otherwise
         """
-        domain = email.split('@')[-1].lower()
         return domain not in self.business_domains
     
     def extract_phones(self, text):
@@ -135,22 +271,20 @@ class ContactExtractor:
             return []
         
         results = []
-        for pattern in self.phone_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                # Format the phone number
-                formatted = self._format_phone(match)
-                if formatted:
-                    results.append({
-                        'phone': formatted,
-                        'original': match
-                    })
+        for match in _PHONE_RE.findall(text):
+            # Format the phone number
+            formatted = self._format_phone(match)
+            if formatted:
+                results.append({
+                    'phone': formatted,
+                    'original': match
+                })
         
         # Remove duplicates (keeping the first occurrence)
         unique_results = []
         seen = set()
         for item in results:
-            normalized = re.sub(r'\D', '', item['phone'])
+            normalized = item['phone'].translate(_NONDIGIT_DELETE)
             if normalized not in seen and len(normalized) >= 7:
                 seen.add(normalized)
                 unique_results.append(item)
@@ -167,7 +301,7 @@ class ContactExtractor:
             str: Formatted phone number
         """
         # Remove non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(_NONDIGIT_DELETE)
         
         # Format based on length
         if len(digits) == 10:  # US number without country code
@@ -192,32 +326,28 @@ class ContactExtractor:
             return []
         
         # Split text into sentences
-        sentences = sent_tokenize(text)
+        sentences, lowered, _ = preprocess(text, self.fast_sentences)
         
+        # Sections are tracked as sentence index ranges and joined only once
         contact_sections = []
-        in_contact_section = False
-        current_section = []
+        section_start = None
         
-        for sentence in sentences:
+        for i, sentence_lower in enumerate(lowered):
             # Check if sentence indicates start of contact section
-            if any(re.search(pattern, sentence.lower()) for pattern in self.contact_section_patterns):
-                if in_contact_section and current_section:
-                    contact_sections.append(' '.join(current_section))
-                in_contact_section = True
-                current_section = [sentence]
-            elif in_contact_section:
-                # If we're in a contact section, add the sentence
-                current_section.append(sentence)
-                
-                # Check if this sentence likely ends the section
-                if len(current_section) > 5 or sentence.endswith('.'):
-                    contact_sections.append(' '.join(current_section))
-                    in_contact_section = False
-                    current_section = []
+            if self._contact_section_matcher.search(sentence_lower):
+                if section_start is not None:
+                    contact_sections.append(' '.join(sentences[section_start:i]))
+                section_start = i
+            elif section_start is not None:
+                # If we're in a contact section, the sentence belongs to it;
+                # check if this sentence likely ends the section
+                if i - section_start >= 5 or sentences[i].endswith('.'):
+                    contact_sections.append(' '.join(sentences[section_start:i + 1]))
+                    section_start = None
         
         # Add any remaining section
-        if in_contact_section and current_section:
-            contact_sections.append(' '.join(current_section))
+        if section_start is not None:
+            contact_sections.append(' '.join(sentences[section_start:]))
         
         return contact_sections
     
@@ -233,25 +363,45 @@ class ContactExtractor:
         if not text:
             return []
         
-        # Simple pattern for names (2-3 capitalized words in sequence)
-        name_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})'
-        potential_names = re.findall(name_pattern, text)
-        
-        # Filter out common non-name capitalized phrases
-        filtered_names = []
-        for name in potential_names:
-            words = name.split()
-            if len(words) >= 2 and all(len(word) > 1 for word in words):
-                filtered_names.append(name)
-        
-        return filtered_names
+        # Single pass over the tokens, collecting runs of Title-case words;
+        # punctuation before or after a word breaks the run
+        names = []
+        run = []
+        
+        def flush():
+            # Split a run into names of 2-3 words, longest first
+            for i in range(0, len(run), 3):
+                chunk = run[i:i + 3]
+                if len(chunk) >= 2:
+                    names.append(' '.join(chunk))
+            run.clear()
+        
+        for token in text.split():
+            word = token.strip(string.punctuation)
+            if not _is_title_word(word):
+                flush()
+                continue
+            if token[0] != word[0]:
+                flush()
+            run.append(word)
+            if token[-1] != word[-1]:
+                flush()
+        flush()
+        
+        return names
 
 
 class CompanyExtractor:
     """Advanced company information extractor."""
     
-    def __init__(self):
-        """Initialize the company extractor."""
+    def __init__(self, fast_sentences=False):
+        """Initialize the company extractor.
+        
+        Args:
+            fast_sentences (bool): Split sentences with a regex instead of NLTK Punkt
+        """
+        self.fast_sentences = fast_sentences
+        
         # Common company suffixes
         self.company_suffixes = [
             'Inc', 'LLC', 'Ltd', 'Corp', 'Corporation', 'Company', 'Co',
@@ -265,6 +415,23 @@ class CompanyExtractor:
             'Authority', 'Administration', 'County', 'City of', 'State of',
             'Government', 'Federal', 'Municipal', 'Public', 'District'
         ]
+        
+        # Single-pass alternations over all suffixes / indicators. The name is
+        # non-greedy so it ends at the first suffix ("Acme Security Inc and
+        # Beta Corp" gives two companies); consecutive suffixes such as
+        # "Services Group" stay part of the same name
+        suffix_alt = '|'.join(_fast_re.escape(s) for s in self.company_suffixes)
+        govt_alt = '|'.join(_fast_re.escape(i) for i in self.govt_indicators)
+        self._company_combined = _fast_re.compile(
+            r'([A-Z][A-Za-z0-9\s&\',]+?)\s+(?P<suf>(?:' + suffix_alt + r')\b(?:\s+(?:' + suffix_alt + r')\b)*)'
+        )
+        self._govt_combined = _fast_re.compile(
+            r'[A-Z][A-Za-z0-9\s&\',]+\s+(?:' + govt_alt + r')|(?:' + govt_alt + r')\s+[A-Z][A-Za-z0-9\s&\',]+'
+        )
+        self._norm_suffix_re = re.compile(
+            r'(?:\s+(?:' + '|'.join(re.escape(s.lower()) for s in self.company_suffixes) + r'))+\s*$'
+        )
+        self._govt_indicator_matcher = MultiPatternMatcher(re.escape(i.lower()) for i in self.govt_indicators)
     
     def extract_companies(self, text):
         """Extract company names from text.
@@ -278,36 +445,37 @@ class CompanyExtractor:
         if not text:
             return []
         
-        # Split text into sentences for context
-        sentences = sent_tokenize(text)
+        # Sentence offsets for looking up the context of each match
+        _, _, spans = preprocess(text, self.fast_sentences)
+        spans = spans or ((0, len(text)),)
+        starts = [start for start, _ in spans]
+        
+        def context_for(pos):
+            index = max(bisect_right(starts, pos) - 1, 0)
+            start, end = spans[index]
+            return text[start:end]
         
         companies = []
         
-        # Pattern for company names with suffixes
-        for suffix in self.company_suffixes:
-            pattern = r'([A-Z][A-Za-z0-9\s&\',]+)\s+' + re.escape(suffix) + r'\b'
-            for sentence in sentences:
-                matches = re.findall(pattern, sentence)
-                for match in matches:
-                    if len(match.strip()) > 2:  # Avoid very short matches
-                        companies.append({
-                            'name': f"{match.strip()} {suffix}",
-                            'is_government': False,
-                            'context': sentence
-                        })
-        
-        # Pattern for government agencies
-        for indicator in self.govt_indicators:
-            pattern = r'([A-Z][A-Za-z0-9\s&\',]+\s+' + re.escape(indicator) + r'|' + re.escape(indicator) + r'\s+[A-Z][A-Za-z0-9\s&\',]+)'
-            for sentence in sentences:
-                matches = re.findall(pattern, sentence)
-                for match in matches:
-                    if len(match.strip()) > 2:  # Avoid very short matches
-                        companies.append({
-                            'name': match.strip(),
-                            'is_government': True,
-                            'context': sentence
-                        })
+        # Company names with suffixes, one pass over the text
+        for match in self._company_combined.finditer(text):
+            name = match.group(1).strip()
+            if len(name) > 2:  # Avoid very short matches
+                companies.append({
+                    'name': f"{name} {match.group('suf')}",
+                    'is_government': False,
+                    'context': context_for(match.start())
+                })
+        
+        # Government agencies, one pass over the text
+        for match in self._govt_combined.finditer(text):
+            name = match.group(0).strip()
+            if len(name) > 2:  # Avoid very short matches
+                companies.append({
+                    'name': name,
+                    'is_government': True,
+                    'context': context_for(match.start())
+                })
         
         # Remove duplicates while preserving order
         unique_companies = []
@@ -336,11 +504,10 @@ class CompanyExtractor:
         normalized = name.lower()
         
         # Remove common suffixes
-        for suffix in [s.lower() for s in self.company_suffixes]:
-            normalized = re.sub(r'\s+' + re.escape(suffix) + r'\s*$', '', normalized)
+        normalized = self._norm_suffix_re.sub('', normalized)
         
         # Remove punctuation
-        normalized = normalized.translate(str.maketrans('', '', string.punctuation))
+        normalized = normalized.translate(_PUNCT_TRANSLATE)
         
         # Remove extra whitespace
         normalized = ' '.join(normalized.split())
@@ -359,26 +526,27 @@ class CompanyExtractor:
         if not name:
             return False
         
-        name_lower = name.lower()
-        
         # Check for government indicators
-        for indicator in [i.lower() for i in self.govt_indicators]:
-            if indicator in name_lower:
-                return True
-        
-        return False
+        return self._govt_indicator_matcher.search(name.lower())
 
 
 class RequirementsExtractor:
     """Extracts job requirements and qualifications from text."""
     
-    def __init__(self):
-        """Initialize the requirements extractor."""
+    def __init__(self, fast_sentences=False):
+        """Initialize the requirements extractor.
+        
+        Args:
+            fast_sentences (bool): Split sentences with a regex instead of NLTK Punkt
+        """
+        self.fast_sentences = fast_sentences
+        
         # Keywords indicating requirements
         self.requirement_indicators = [
             'required', 'requirements', 'qualifications', 'must have',
             'necessary', 'essential', 'needed', 'minimum', 'mandatory'
         ]
+        self._req_indicator_matcher = MultiPatternMatcher(re.escape(i) for i in self.requirement_indicators)
         
         # Security-specific requirement keywords
         self.security_requirements = [
@@ -403,33 +571,29 @@ class RequirementsExtractor:
             return {}
         
         # Split text into sentences
-        sentences = sent_tokenize(text)
+        sentences, lowered, _ = preprocess(text, self.fast_sentences)
         
         # Find requirement sections
         requirement_sections = []
-        in_req_section = False
-        current_section = []
+        section_start = None
         
-        for sentence in sentences:
+        for i, sentence_lower in enumerate(lowered):
             # Check if sentence indicates start of requirements section
-            if any(indicator in sentence.lower() for indicator in self.requirement_indicators):
-                if in_req_section and current_section:
-                    requirement_sections.append(' '.join(current_section))
-                in_req_section = True
-                current_section = [sentence]
-            elif in_req_section:
-                # If we're in a requirements section, add the sentence
-                current_section.append(sentence)
-                
-                # Check if this sentence likely ends the section
-                if len(current_section) > 10 or sentence.endswith('.') and len(sentence) < 20:
-                    requirement_sections.append(' '.join(current_section))
-                    in_req_section = False
-                    current_section = []
+            if self._req_indicator_matcher.search(sentence_lower):
+                if section_start is not None:
+                    requirement_sections.append(' '.join(sentences[section_start:i]))
+                section_start = i
+            elif section_start is not None:
+                # If we're in a requirements section, the sentence belongs to it;
+                # check if this sentence likely ends the section
+                sentence = sentences[i]
+                if i - section_start >= 10 or sentence.endswith('.') and len(sentence) < 20:
+                    requirement_sections.append(' '.join(sentences[section_start:i + 1]))
+                    section_start = None
         
         # Add any remaining section
-        if in_req_section and current_section:
-            requirement_sections.append(' '.join(current_section))
+        if section_start is not None:
+            requirement_sections.append(' '.join(sentences[section_start:]))
         
         # If no specific sections found, use the whole text
         if not requirement_sections:
@@ -6,14 +6,42 @@ allowing the system to run at specified intervals and manage the scraping workfl
 """
 
 import os
-import time
 import json
 import logging
 import threading
 import schedule
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional fast JSON, fall back to the standard library
+    orjson = None
+
+
+def _dumps_line(obj):
+    """Serialize an object as one JSON line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj).encode('utf-8') + b'\n'
+
+
+def _loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Maps a weekday name to the matching schedule.Job attribute (job.monday, ...)
+_WEEKDAY_JOBS = {
+    day: attrgetter(day)
+    for day in ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+}
+
+
 class AutomationScheduler:
     """Manages scheduling and automation of the lead generation process."""
     
@@ -53,52 +81,103 @@ class AutomationScheduler:
         self.next_run = None
         self.run_history = []
         
+        # Set when the schedule changes to wake the scheduler loop
+        self._schedule_changed = threading.Event()
+        
         # Maximum history entries to keep
         self.max_history = config.get('max_history', 100)
         
+        # Resolve the history file location once
+        base_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        self._history_path = str(base_dir / "data" / "run_history.jsonl")
+        
         # Load run history if exists
         self._load_history()
     
     def _load_history(self):
-        """Load run history from file."""
+        """Load run history from the append-only history log."""
         history_path = self._get_history_path()
+        legacy_path = os.path.splitext(history_path)[0] + '.json'
+        self._history_lines = 0
         
-        if os.path.exists(history_path):
-            try:
-                with open(history_path, 'r') as f:
-                    self.run_history = json.load(f)
-                self.logger.info(f"Loaded {len(self.run_history)} run history entries")
-            except Exception as e:
-                self.logger.error(f"Error loading run history: {str(e)}")
-                self.run_history = []
+        try:
+            if os.path.exists(history_path):
+                entries = []
+                skipped = 0
+                with open(history_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            entries.append(_loads(line))
+                        except ValueError:
+                            # A torn line from a crash; keep the other entries
+                            skipped += 1
+                            self.logger.warning("Skipping unreadable run history line")
+                self._history_lines = len(entries)
+                self.run_history = entries[-self.max_history:]
+                if skipped:
+                    # Rewrite without the bad lines so new entries aren't
+                    # appended onto a torn one
+                    self._compact_history()
+            elif os.path.exists(legacy_path):
+                # Migrate the old single-JSON-document history
+                with open(legacy_path, 'rb') as f:
+                    self.run_history = _loads(f.read())[-self.max_history:]
+                self._compact_history()
+            else:
+                return
+            self.logger.info(f"Loaded {len(self.run_history)} run history entries")
+        except Exception as e:
+            self.logger.error(f"Error loading run history: {str(e)}")
+            self.run_history = []
     
-    def _save_history(self):
-        """Save run history to file."""
+    def _save_history(self, run_data):
+        """Append a run to the history log.
+        
+        Args:
+            run_data (dict): Run entry to append
+        """
         history_path = self._get_history_path()
         
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(history_path), exist_ok=True)
             
-            # Trim history to max size
+            # Trim in-memory history to max size
             if len(self.run_history) > self.max_history:
                 self.run_history = self.run_history[-self.max_history:]
             
-            with open(history_path, 'w') as f:
-                json.dump(self.run_history, f, indent=2)
+            with open(history_path, 'ab') as f:
+                f.write(_dumps_line(run_data))
+            self._history_lines += 1
+            
+            # Rewrite the log only once it has grown well past the limit
+            if self._history_lines > 2 * self.max_history:
+                self._compact_history()
             
-            self.logger.info(f"Saved {len(self.run_history)} run history entries")
+            self.logger.info(f"Saved run history entry ({len(self.run_history)} in memory)")
         except Exception as e:
             self.logger.error(f"Error saving run history: {str(e)}")
     
+    def _compact_history(self):
+        """Rewrite the history log with only the retained entries."""
+        history_path = self._get_history_path()
+        os.makedirs(os.path.dirname(history_path), exist_ok=True)
+        
+        tmp_path = history_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(_dumps_line(entry) for entry in self.run_history)
+        os.replace(tmp_path, history_path)
+        self._history_lines = len(self.run_history)
+    
     def _get_history_path(self):
         """Get path to run history file.
         
         Returns:
             str: Path to history file
         """
-        base_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        return str(base_dir / "data" / "run_history.json")
+        return self._history_path
     
     def setup_schedule(self):
         """Set up the automation schedule based on configuration."""
@@ -119,20 +198,9 @@ class AutomationScheduler:
             
             for day in days:
                 day = day.lower()
-                if day == 'monday':
-                    schedule.every().monday.at(time_str).do(self.run_automation)
-                elif day == 'tuesday':
-                    schedule.every().tuesday.at(time_str).do(self.run_automation)
-                elif day == 'wednesday':
-                    schedule.every().wednesday.at(time_str).do(self.run_automation)
-                elif day == 'thursday':
-                    schedule.every().thursday.at(time_str).do(self.run_automation)
-                elif day == 'friday':
-                    schedule.every().friday.at(time_str).do(self.run_automation)
-                elif day == 'saturday':
-                    schedule.every().saturday.at(time_str).do(self.run_automation)
-                elif day == 'sunday':
-                    schedule.every().sunday.at(time_str).do(self.run_automation)
+                weekday_job = _WEEKDAY_JOBS.get(day)
+                if weekday_job:
+                    weekday_job(schedule.every()).at(time_str).do(self.run_automation)
                 
                 self.logger.info(f"Scheduled weekly run on {day} at {time_str}")
         
@@ -151,6 +219,9 @@ class AutomationScheduler:
         
         # Calculate next run time
         self._update_next_run()
+        
+        # Wake the scheduler loop so it picks up the new timings
+        self._schedule_changed.set()
     
     def _update_next_run(self):
         """Update the next scheduled run time."""
@@ -187,49 +258,62 @@ class AutomationScheduler:
             
             total_leads = 0
             
-            # Process each source
-            for source in sources:
-                try:
+            # Scraping is network-bound, so run the sources in parallel and
+            # store their leads from this thread as each one finishes
+            max_workers = max(1, min(len(sources), self.config.get('max_parallel', 4)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for source in sources:
                     self.logger.info(f"Processing source: {source}")
-                    
-                    # Run the scraper
-                    leads = self.scraper_manager.run_scraper(source)
-                    
-                    if leads:
-                        # Store leads in database
-                        for lead in leads:
+                    futures[executor.submit(self.scraper_manager.run_scrapers, [source])] = source
+                
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        # Get the scraper results
+                        leads = future.result()
+                        
+                        if leads:
+                            # Store leads in database in one transaction
                             try:
-                                self.database.store_lead(lead)
-                                total_leads += 1
+                                stored = self.database.store_leads(leads)
                             except Exception as e:
-                                error_msg = f"Error storing lead from {source}: {str(e)}"
+                                error_msg = f"Error storing leads from {source}: {str(e)}"
                                 self.logger.error(error_msg)
                                 run_data['errors'].append(error_msg)
-                        
-                        self.logger.info(f"Generated {len(leads)} leads from {source}")
-                        run_data['sources_processed'].append({
-                            'name': source,
-                            'leads_count': len(leads),
-                            'status': 'success'
-                        })
-                    else:
-                        self.logger.warning(f"No leads generated from {source}")
+                                run_data['sources_processed'].append({
+                                    'name': source,
+                                    'leads_count': 0,
+                                    'status': 'error',
+                                    'error': str(e)
+                                })
+                                continue
+                            
+                            total_leads += stored
+                            self.logger.info(f"Generated {len(leads)} leads from {source}, stored {stored}")
+                            run_data['sources_processed'].append({
+                                'name': source,
+                                'leads_count': stored,
+                                'status': 'success'
+                            })
+                        else:
+                            self.logger.warning(f"No leads generated from {source}")
+                            run_data['sources_processed'].append({
+                                'name': source,
+                                'leads_count': 0,
+                                'status': 'no_leads'
+                            })
+                    
+                    except Exception as e:
+                        error_msg = f"Error processing source {source}: {str(e)}"
+                        self.logger.error(error_msg)
+                        run_data['errors'].append(error_msg)
                         run_data['sources_processed'].append({
                             'name': source,
                             'leads_count': 0,
-                            'status': 'no_leads'
+                            'status': 'error',
+                            'error': str(e)
                         })
-                
-                except Exception as e:
-                    error_msg = f"Error processing source {source}: {str(e)}"
-                    self.logger.error(error_msg)
-                    run_data['errors'].append(error_msg)
-                    run_data['sources_processed'].append({
-                        'name': source,
-                        'leads_count': 0,
-                        'status': 'error',
-                        'error': str(e)
-                    })
             
             # Update run data
             run_data['leads_generated'] = total_leads
@@ -254,7 +338,7 @@ class AutomationScheduler:
             
             # Add to history
             self.run_history.append(run_data)
-            self._save_history()
+            self._save_history(run_data)
             
             # Update next run time
             self._update_next_run()
@@ -277,10 +361,20 @@ class AutomationScheduler:
         self.logger.info("Automation scheduler started")
     
     def _run_scheduler(self):
-        """Run the scheduler loop."""
+        """Run the scheduler loop.
+        
+        Sleeps until the next job is due instead of polling every second;
+        setup_schedule wakes the loop early when the schedule changes.
+        """
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                # No jobs scheduled
+                self._schedule_changed.wait(60)
+            elif idle > 0:
+                self._schedule_changed.wait(idle)
+            self._schedule_changed.clear()
             schedule.run_pending()
-            time.sleep(1)
     
     def stop(self):
         """Stop the scheduler."""
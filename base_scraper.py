@@ -4,11 +4,109 @@ Base Scraper for Security Leads Automation
 This module provides a base class for all source-specific scrapers.
 """
 
-import requests
-from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+import os
 import time
 import random
+import socket
+import threading
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from abc import ABC, abstractmethod
+
+CACHE_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))) / "data" / "cache"
+
+@lru_cache(maxsize=None)
+def _beautiful_soup():
+    """Import BeautifulSoup on first use.
+    
+    bs4 is only needed once a scraper parses a page, so importing it lazily
+    keeps it off the startup path of tools that never scrape.
+    
+    Returns:
+        type: The BeautifulSoup class
+    """
+    from bs4 import BeautifulSoup
+    return BeautifulSoup
+
+@lru_cache(maxsize=None)
+def _scraper_adapter():
+    """Build the HTTPAdapter subclass used by scraper sessions.
+    
+    Returns:
+        type: HTTPAdapter subclass
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    
+    # urllib3 already disables Nagle's algorithm; add keep-alive probes so
+    # idle pooled sockets are not silently dropped
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    
+    class ScraperAdapter(HTTPAdapter):
+        """HTTPAdapter whose pooled connections use keep-alive probes and
+        whose sends are paced by a RateLimiter."""
+        
+        def __init__(self, *args, rate_limiter=None, **kwargs):
+            self.rate_limiter = rate_limiter
+            super().__init__(*args, **kwargs)
+        
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs.setdefault("socket_options", socket_options)
+            super().init_poolmanager(*args, **kwargs)
+        
+        def send(self, request, **kwargs):
+            # Responses served from the cache never reach the adapter, so
+            # only requests that go to the network are paced
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return super().send(request, **kwargs)
+    
+    return ScraperAdapter
+
+class RateLimiter:
+    """Token-bucket limiter pacing requests to one source.
+    
+    Called before each network request; blocks until a token is available
+    so requests are spread out instead of bursting into 429s.
+    """
+    
+    def __init__(self, max_calls=1, period=1.0, jitter=0.1):
+        """Initialize the rate limiter.
+        
+        Args:
+            max_calls (int, optional): Bucket capacity. Defaults to 1.
+            period (float, optional): Seconds to refill max_calls tokens. Defaults to 1.0.
+            jitter (float, optional): Random extra delay as a fraction of the
+                refill interval, to desynchronize parallel scrapers. Defaults to 0.1.
+        """
+        self.max_calls = max_calls
+        self.interval = period / max_calls if max_calls else 0.0
+        self.jitter = jitter
+        self._tokens = float(max_calls)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available and consume it."""
+        if self.interval <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_calls, self._tokens + (now - self._last) / self.interval)
+            self._last = now
+            
+            wait = 0.0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) * self.interval
+                wait += random.uniform(0, self.jitter * self.interval)
+            self._tokens -= 1
+        
+        # The token is already reserved, so later callers wait behind this
+        # one without the lock being held while sleeping
+        if wait:
+            time.sleep(wait)
 
 class BaseScraper(ABC):
     """Base class for all scrapers."""
@@ -20,60 +118,110 @@ class BaseScraper(ABC):
             config (dict): Source configuration
             logger (logging.Logger): Logger instance
         """
+        # Import the HTTP stack when a scraper is created, not when the module is imported
+        from requests_cache import CachedSession
+        from urllib3.util.retry import Retry
+        
         self.config = config
         self.logger = logger
-        self.session = requests.Session()
         self.max_retries = 3
         self.timeout = 30
+        
+        # Pace requests to the source: at most max_calls requests per
+        # min_seconds window (one by default)
+        request_delay = config.get("request_delay", {})
+        self.rate_limiter = RateLimiter(
+            max_calls=request_delay.get("max_calls", 1),
+            period=request_delay.get("min_seconds", 2)
+        )
+        
+        # Cache responses on disk for the source's scrape interval so re-runs
+        # inside that window skip the network; 404s are cached too. Expired
+        # responses with an ETag or Last-Modified are revalidated with a
+        # conditional GET, so unchanged pages come back as a 304
+        scrape_frequency_hours = config.get("scrape_frequency_hours", 24)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        self.session = CachedSession(
+            cache_name=str(CACHE_DIR / self.__class__.__name__),
+            backend="sqlite",
+            expire_after=timedelta(hours=scrape_frequency_hours),
+            allowable_codes=(200, 404)
+        )
+        
+        # Reuse pooled keep-alive connections for listing and detail pages;
+        # transient failures are retried by urllib3 with exponential backoff
+        retry = Retry(
+            total=self.max_retries - 1,  # max_retries counts attempts
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True
+        )
+        adapter = _scraper_adapter()(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=retry,
+            rate_limiter=self.rate_limiter
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
     
-    def _make_request(self, url, user_agent=None, headers=None, params=None):
-        """Make an HTTP request with retry logic.
+    def _make_request(self, url, user_agent=None, headers=None, params=None, expire_after=None):
+        """Make an HTTP request; retries are handled by the session adapter.
         
         Args:
             url (str): URL to request
             user_agent (str, optional): User agent string. Defaults to None.
             headers (dict, optional): Additional headers. Defaults to None.
             params (dict, optional): URL parameters. Defaults to None.
+            expire_after (timedelta, optional): How long to cache this response,
+                overriding the session default. Defaults to None.
             
         Returns:
             requests.Response: Response object
         """
+        import requests
+        
         if headers is None:
             headers = {}
         
         if user_agent:
             headers['User-Agent'] = user_agent
         
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(
-                    url, 
-                    headers=headers, 
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt+1}/{self.max_retries}): {str(e)}")
-                if attempt < self.max_retries - 1:
-                    # Wait before retrying with exponential backoff
-                    wait_time = 2 ** attempt + random.uniform(0, 1)
-                    time.sleep(wait_time)
-                else:
-                    self.logger.error(f"Request failed after {self.max_retries} attempts: {str(e)}")
-                    raise
-    
-    def _parse_html(self, html_content):
-        """Parse HTML content using BeautifulSoup.
+        try:
+            response = self.session.get(
+                url, 
+                headers=headers, 
+                params=params,
+                timeout=self.timeout,
+                expire_after=expire_after
+            )
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Request failed after {self.max_retries} attempts: {str(e)}")
+            raise
+    
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+    
+    def clear_cache(self):
+        """Drop all cached responses for this scraper."""
+        self.session.cache.clear()
+    
+    def _parse_html(self, html_content, parse_only=None):
+        """Parse HTML content using BeautifulSoup with the lxml parser.
         
         Args:
             html_content (str): HTML content
+            parse_only (SoupStrainer, optional): Only build matching parts of
+                the tree. Defaults to None.
             
         Returns:
             BeautifulSoup: Parsed HTML
         """
-        return BeautifulSoup(html_content, 'html.parser')
+        return _beautiful_soup()(html_content, 'lxml', parse_only=parse_only)
     
     @abstractmethod
     def scrape(self, user_agent=None):
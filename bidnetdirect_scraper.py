@@ -5,9 +5,51 @@ This module implements a scraper for BidNetDirect, extracting security service b
 """
 
 import re
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from ..core.base_scraper import BaseScraper
+from ..core.models import Lead, Organization, Contact, Opportunity
 from ..utils.data_utils import extract_email, extract_phone, extract_date, detect_security_keywords, calculate_confidence_score
 
+# Pre-compiled CSS selectors (case-insensitive class/id substring matches)
+_LISTING_SEL = sv.compile('div[class*="solicitation-item" i]')
+_BID_ROW_SEL = sv.compile('tr[class*="bid-row" i]')
+_GENERIC_LISTING_SEL = sv.compile('div.bid-listing, div.solicitation, tr.bid')
+_TITLE_SEL = sv.compile('a[class*="title" i]')
+_AGENCY_SEL = sv.compile('div[class*="agency" i], td[class*="agency" i]')
+_LOCATION_SEL = sv.compile('div[class*="location" i], td[class*="location" i]')
+_CLOSING_SEL = sv.compile('div[class*="closing" i], td[class*="closing" i]')
+_DESCRIPTION_SEL = sv.compile('div[class*="description" i]')
+_DESCRIPTION_ID_SEL = sv.compile('div[id*="description" i]')
+_CONTACT_SEL = sv.compile('div[class*="contact" i]')
+
+_DETAIL_CLASS_RE = re.compile("description|contact", re.I)
+_DETAIL_ID_RE = re.compile("description", re.I)
+
+
+def _is_detail_div(name, attrs):
+    """Check if a tag is a description or contact div on a detail page."""
+    if name != "div":
+        return False
+    classes = attrs.get("class") or ""
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+    return bool(_DETAIL_CLASS_RE.search(classes) or _DETAIL_ID_RE.search(attrs.get("id") or ""))
+
+
+_DETAIL_STRAINER = SoupStrainer(_is_detail_div)
+
+# Leads whose combined text is shorter than this skip email/phone/keyword
+# extraction and get a fixed low confidence score
+_MIN_TEXT_LEN = 40
+_STUB_CONFIDENCE = 0.3
+
+# Most concurrent detail page fetches per scrape; also capped by the number
+# of calls the source's rate limiter allows per window
+_DETAIL_WORKERS = 8
+
 class BidnetdirectScraper(BaseScraper):
     """Scraper for BidNetDirect website."""
     
@@ -37,75 +79,48 @@ class BidnetdirectScraper(BaseScraper):
         try:
             # Make request to the main page
             response = self._make_request(self.base_url, user_agent=user_agent)
-            soup = self._parse_html(response.text)
+            soup = self._parse_html(response.content)
             
             # Find all bid listings
-            listings = soup.find_all("div", class_=lambda c: c and "solicitation-item" in c.lower())
+            listings = _LISTING_SEL.select(soup)
             
             if not listings:
                 # Try alternative selectors if the above doesn't work
-                listings = soup.find_all("tr", class_=lambda c: c and "bid-row" in c.lower())
+                listings = _BID_ROW_SEL.select(soup)
             
             if not listings:
                 # Try more generic approach
-                listings = soup.select("div.bid-listing, div.solicitation, tr.bid")
+                listings = _GENERIC_LISTING_SEL.select(soup)
             
             self.logger.info(f"Found {len(listings)} listings on BidNetDirect")
             
-            # Process each listing
+            # Extract basic information from each listing
+            items = []
             for listing in listings[:10]:  # Limit to first 10 for testing
                 try:
-                    # Extract basic information from listing
-                    title_elem = listing.find("a", class_=lambda c: c and "title" in c.lower()) or listing.find("a")
-                    title = title_elem.text.strip() if title_elem else ""
-                    
-                    # Extract URL for detailed page
-                    detail_url = None
-                    if title_elem and title_elem.get("href"):
-                        detail_url = title_elem["href"]
-                        if not detail_url.startswith("http"):
-                            detail_url = "https://www.bidnetdirect.com" + detail_url
-                    
-                    # Extract agency/organization
-                    agency_elem = listing.find("div", class_=lambda c: c and "agency" in c.lower()) or listing.find("td", class_=lambda c: c and "agency" in c.lower())
-                    agency = agency_elem.text.strip() if agency_elem else ""
-                    
-                    # Extract location
-                    location_elem = listing.find("div", class_=lambda c: c and "location" in c.lower()) or listing.find("td", class_=lambda c: c and "location" in c.lower())
-                    location = location_elem.text.strip() if location_elem else ""
-                    
-                    # Extract closing date
-                    closing_elem = listing.find("div", class_=lambda c: c and "closing" in c.lower()) or listing.find("td", class_=lambda c: c and "closing" in c.lower())
-                    closing_date = closing_elem.text.strip() if closing_elem else ""
-                    
-                    # If we have a detail URL, scrape the detailed page
-                    description = ""
-                    contact_info = ""
-                    if detail_url:
-                        try:
-                            detail_response = self._make_request(detail_url, user_agent=user_agent)
-                            detail_soup = self._parse_html(detail_response.text)
-                            
-                            # Extract description
-                            desc_elem = detail_soup.find("div", class_=lambda c: c and "description" in c.lower()) or detail_soup.find("div", id=lambda i: i and "description" in i.lower())
-                            description = desc_elem.text.strip() if desc_elem else ""
-                            
-                            # Extract contact information
-                            contact_elem = detail_soup.find("div", class_=lambda c: c and "contact" in c.lower())
-                            contact_info = contact_elem.text.strip() if contact_elem else ""
-                        except Exception as e:
-                            self.logger.warning(f"Error scraping detail page {detail_url}: {str(e)}")
-                    
+                    items.append(self._parse_listing(listing))
+                except Exception as e:
+                    self.logger.warning(f"Error processing listing: {str(e)}")
+            
+            # Fetch detail pages concurrently over the pooled session when the
+            # rate limiter lets more than one request through at a time
+            detail_urls = [item.pop("detail_url") for item in items]
+            workers = min(_DETAIL_WORKERS, self.rate_limiter.max_calls)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    details = list(executor.map(self._fetch_detail, detail_urls, repeat(user_agent)))
+            else:
+                details = [self._fetch_detail(detail_url, user_agent) for detail_url in detail_urls]
+            
+            for item, detail_url, (description, contact_info) in zip(items, detail_urls, details):
+                try:
                     # Create lead data
-                    lead_data = self.extract_lead_data({
-                        "title": title,
-                        "agency": agency,
-                        "location": location,
-                        "closing_date": closing_date,
-                        "description": description,
-                        "contact_info": contact_info,
-                        "source_url": detail_url or self.base_url
-                    })
+                    lead_data = self.extract_lead_data(dict(
+                        item,
+                        description=description,
+                        contact_info=contact_info,
+                        source_url=detail_url or self.base_url
+                    ))
                     
                     leads.append(lead_data)
                 except Exception as e:
@@ -116,6 +131,87 @@ class BidnetdirectScraper(BaseScraper):
             self.logger.error(f"Error scraping BidNetDirect: {str(e)}")
             return []
     
+    def _fetch_detail(self, detail_url, user_agent=None):
+        """Fetch a detail page and extract its description and contact information.
+        
+        Args:
+            detail_url (str): Detail page URL, or None
+            user_agent (str, optional): User agent string. Defaults to None.
+            
+        Returns:
+            tuple: (description, contact_info); empty strings if unavailable
+        """
+        if not detail_url:
+            return "", ""
+        
+        try:
+            detail_response = self._make_request(detail_url, user_agent=user_agent)
+            return self._parse_detail(detail_response.content)
+        except Exception as e:
+            self.logger.warning(f"Error scraping detail page {detail_url}: {str(e)}")
+            return "", ""
+    
+    def _parse_listing(self, listing):
+        """Extract basic information from a listing element.
+        
+        Args:
+            listing: Listing element
+            
+        Returns:
+            dict: Listing fields and the detail page URL (or None)
+        """
+        title_elem = _TITLE_SEL.select_one(listing) or listing.find("a")
+        title = title_elem.text.strip() if title_elem else ""
+        
+        # Extract URL for detailed page
+        detail_url = None
+        if title_elem and title_elem.get("href"):
+            detail_url = title_elem["href"]
+            if not detail_url.startswith("http"):
+                detail_url = "https://www.bidnetdirect.com" + detail_url
+        
+        # Extract agency/organization
+        agency_elem = _AGENCY_SEL.select_one(listing)
+        agency = agency_elem.text.strip() if agency_elem else ""
+        
+        # Extract location
+        location_elem = _LOCATION_SEL.select_one(listing)
+        location = location_elem.text.strip() if location_elem else ""
+        
+        # Extract closing date
+        closing_elem = _CLOSING_SEL.select_one(listing)
+        closing_date = closing_elem.text.strip() if closing_elem else ""
+        
+        return {
+            "title": title,
+            "agency": agency,
+            "location": location,
+            "closing_date": closing_date,
+            "detail_url": detail_url
+        }
+    
+    def _parse_detail(self, html):
+        """Extract description and contact information from a detail page.
+        
+        Args:
+            html (bytes): Detail page HTML
+            
+        Returns:
+            tuple: (description, contact_info)
+        """
+        # Only build the description/contact subtrees of the page
+        detail_soup = BeautifulSoup(html, "lxml", parse_only=_DETAIL_STRAINER)
+        
+        # Extract description
+        desc_elem = _DESCRIPTION_SEL.select_one(detail_soup) or _DESCRIPTION_ID_SEL.select_one(detail_soup)
+        description = desc_elem.text.strip() if desc_elem else ""
+        
+        # Extract contact information
+        contact_elem = _CONTACT_SEL.select_one(detail_soup)
+        contact_info = contact_elem.text.strip() if contact_elem else ""
+        
+        return description, contact_info
+    
     def extract_lead_data(self, item):
         """Extract lead data from a scraped item.
         
@@ -129,63 +225,93 @@ class BidnetdirectScraper(BaseScraper):
         description = item.get("description", "")
         contact_info = item.get("contact_info", "")
         
-        all_text = f"{item.get('title', '')} {item.get('agency', '')} {description} {contact_info}"
+        # Build the combined text once and share it between the extractors
+        all_text = " ".join(filter(None, (item.get('title', ''), item.get('agency', ''), description, contact_info)))
+        
+        if len(all_text) < _MIN_TEXT_LEN:
+            # Too little text (e.g. the detail page fetch failed) for the
+            # regex and keyword extractors to find anything worth scoring
+            return self._stub_lead(item, description).to_dict()
         
         emails = extract_email(all_text)
         phones = extract_phone(all_text)
         
         # Extract security keywords
-        keywords = detect_security_keywords(all_text)
+        keywords = detect_security_keywords(all_text.lower(), lowered=True)
         
         # Determine if it's for armed or unarmed security
-        is_armed = False
-        if keywords.get('security_type'):
-            is_armed = any('armed' in keyword for keyword in keywords.get('security_type', []))
+        is_armed = any('armed' in keyword for keyword in keywords['security_type'])
         
         # Determine opportunity type
         opportunity_type = "general"
-        if keywords.get('event_type'):
+        if keywords['event_type']:
             opportunity_type = "event"
-        elif keywords.get('construction'):
+        elif keywords['construction']:
             opportunity_type = "construction"
         
         # Create organization data
-        organization = {
-            "name": item.get("agency", ""),
-            "is_government": True  # BidNetDirect primarily has government contracts
-        }
+        organization = Organization(
+            name=item.get("agency", ""),
+            is_government=True  # BidNetDirect primarily has government contracts
+        )
         
         # Create contacts
         contacts = []
         if emails or phones:
-            contact = {
-                "email": emails[0] if emails else "",
-                "phone": phones[0] if phones else ""
-            }
-            contacts.append(contact)
+            contacts.append(Contact(
+                email=emails[0] if emails else "",
+                phone=phones[0] if phones else ""
+            ))
         
         # Create opportunity
-        opportunity = {
-            "title": item.get("title", ""),
-            "description": description,
-            "location": item.get("location", ""),
-            "requirements": ", ".join(keywords.get('requirements', [])),
-            "opportunity_type": opportunity_type,
-            "is_armed": is_armed,
-            "end_date": item.get("closing_date", "")
-        }
+        opportunity = Opportunity(
+            title=item.get("title", ""),
+            description=description,
+            location=item.get("location", ""),
+            requirements=", ".join(keywords['requirements']),
+            opportunity_type=opportunity_type,
+            is_armed=is_armed,
+            end_date=item.get("closing_date", "")
+        )
         
-        # Create lead data
-        lead_data = {
-            "source": "bidnetdirect",
-            "source_url": item.get("source_url", ""),
-            "lead_type": "rfp",
-            "organization": organization,
-            "contacts": contacts,
-            "opportunity": opportunity
-        }
+        # Create lead
+        lead = Lead(
+            source="bidnetdirect",
+            source_url=item.get("source_url", ""),
+            lead_type="rfp",
+            organization=organization,
+            contacts=contacts,
+            opportunity=opportunity
+        )
         
         # Calculate confidence score
-        lead_data["confidence_score"] = calculate_confidence_score(lead_data)
+        lead.confidence_score = calculate_confidence_score(lead)
+        
+        # The rest of the pipeline works on plain dictionaries
+        lead_data = lead.to_dict()
         
         return lead_data
+    
+    def _stub_lead(self, item, description):
+        """Build a low-confidence lead for an item with too little text to analyze.
+        
+        Args:
+            item (dict): Scraped item
+            description (str): Item description
+            
+        Returns:
+            Lead: Lead record with default extraction results
+        """
+        return Lead(
+            source="bidnetdirect",
+            source_url=item.get("source_url", ""),
+            lead_type="rfp",
+            organization=Organization(name=item.get("agency", ""), is_government=True),
+            opportunity=Opportunity(
+                title=item.get("title", ""),
+                description=description,
+                location=item.get("location", ""),
+                end_date=item.get("closing_date", "")
+            ),
+            confidence_score=_STUB_CONFIDENCE
+        )
@@ -7,7 +7,30 @@ including source URLs, credentials, and operational parameters.
 
 import os
 import json
+import itertools
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON, fall back to the standard library
+    orjson = None
+
+
+def _dumps(obj):
+    """Serialize configuration as indented JSON (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON configuration from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ConfigManager:
     """Manages configuration settings for the scraper system."""
@@ -21,6 +44,20 @@ class ConfigManager:
         self.base_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
         self.config_path = config_path or self.base_dir / 'config' / 'config.json'
         self.config = self._load_config()
+        self._build_views()
+        
+    def _build_views(self):
+        """Precompute read-only views derived from the loaded configuration.
+        
+        Accessors return these instead of re-walking the config dict on every
+        call; they are rebuilt whenever the configuration is updated.
+        """
+        sources = self.config.get("sources", {})
+        self._source_configs = MappingProxyType(sources)
+        self._enabled_sources = tuple(name for name, config in sources.items()
+                                      if config.get("enabled", False))
+        user_agents = self.config.get("scraping", {}).get("user_agents", [])
+        self._user_agents = itertools.cycle(user_agents) if user_agents else None
         
     def _load_config(self):
         """Load configuration from file.
@@ -28,16 +65,34 @@ class ConfigManager:
         Returns:
             dict: Configuration settings
         """
-        if not os.path.exists(self.config_path):
+        try:
+            with open(self.config_path, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
             # Create default configuration if it doesn't exist
             default_config = self._create_default_config()
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(default_config, f, indent=4)
+            self._write_config(default_config)
             return default_config
+    
+    def _write_config(self, config):
+        """Atomically write configuration to the config file.
+        
+        The file is written to a temporary sibling and renamed over the
+        original, so a crash mid-write never leaves a truncated config.
         
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        Args:
+            config (dict): Configuration settings
+        """
+        config_dir = os.path.dirname(self.config_path) or '.'
+        os.makedirs(config_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(config))
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
     
     def _create_default_config(self):
         """Create default configuration.
@@ -85,7 +140,8 @@ class ConfigManager:
                 ],
                 "request_delay": {
                     "min_seconds": 2,
-                    "max_seconds": 5
+                    "max_seconds": 5,
+                    "max_calls": 1
                 },
                 "max_retries": 3,
                 "timeout_seconds": 30
@@ -109,16 +165,33 @@ class ConfigManager:
         Returns:
             dict: Source configuration
         """
-        return self.config["sources"].get(source_name, {})
+        return self._source_configs.get(source_name, {})
+    
+    def get_source_configs(self):
+        """Get configuration for all sources.
+        
+        Returns:
+            MappingProxyType: Read-only mapping of source name to configuration
+        """
+        return self._source_configs
     
     def get_enabled_sources(self):
-        """Get list of enabled sources.
+        """Get enabled sources.
+        
+        Returns:
+            tuple: Names of enabled sources
+        """
+        return self._enabled_sources
+    
+    def next_user_agent(self):
+        """Get the next user agent in the configured rotation.
         
         Returns:
-            list: Names of enabled sources
+            str: User agent string, or None if none are configured
         """
-        return [name for name, config in self.config["sources"].items() 
-                if config.get("enabled", False)]
+        if self._user_agents is None:
+            return None
+        return next(self._user_agents)
     
     def get_database_config(self):
         """Get database configuration.
@@ -163,8 +236,8 @@ class ConfigManager:
         """
         try:
             self.config.update(new_config)
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            self._build_views()
+            self._write_config(self.config)
             return True
         except Exception:
             return False
@@ -6,7 +6,127 @@ This module provides utility functions for data extraction, validation, and proc
 
 import re
 import string
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import re2 as _fast_re
+except ImportError:  # Optional linear-time engine, fall back to re
+    _fast_re = re
+
+try:
+    import ahocorasick
+except ImportError:  # Optional, fall back to substring scans
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # Optional, fall back to separate re and automaton scans
+    hyperscan = None
+
+# Pre-compiled patterns; email and phone extraction use re2 when installed
+_EMAIL_RE = _fast_re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# US phone number formats, longest first: +1 (123) 456-7890, (123) 456-7890,
+# 123-456-7890, 123.456.7890, then bare 456-7890
+_PHONE_RE = _fast_re.compile(
+    r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+    r'|\b\d{3}[-.\s]?\d{4}\b'
+)
+
+# Common date formats, each paired with the strptime formats its matches can take
+_DATE_PARSERS = [(re.compile(pattern), formats) for pattern, formats in (
+    (r'\d{1,2}/\d{1,2}/\d{2,4}', ('%m/%d/%Y', '%m/%d/%y')),  # MM/DD/YYYY, M/D/YY
+    (r'\d{1,2}-\d{1,2}-\d{2,4}', ('%m-%d-%Y', '%m-%d-%y')),  # MM-DD-YYYY, M-D-YY
+    (r'\d{1,2}\.\d{1,2}\.\d{2,4}', ('%m.%d.%Y', '%m.%d.%y')),  # MM.DD.YYYY, M.D.YY
+    (r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{2,4}',
+     ('%B %d, %Y', '%B %d %Y'))  # January 1, 2020
+)]
+
+# Common company suffixes removed by normalize_company_name
+_SUFFIX_RES = [re.compile(r'\s+' + re.escape(suffix) + r'\s*$') for suffix in (
+    "inc", "inc.", "incorporated", 
+    "llc", "llc.", "l.l.c.", "limited liability company",
+    "ltd", "ltd.", "limited",
+    "corp", "corp.", "corporation",
+    "co", "co.", "company"
+)]
+
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Keyword categories for detect_security_keywords
+_SECURITY_KEYWORDS = {
+    'security_type': [
+        'armed security', 'unarmed security', 'security guard', 'security officer',
+        'security personnel', 'security staff', 'security service'
+    ],
+    'event_type': [
+        'event security', 'concert security', 'festival security', 'conference security',
+        'wedding security', 'party security', 'corporate event'
+    ],
+    'construction': [
+        'construction site', 'construction security', 'site security',
+        'building site', 'construction project'
+    ],
+    'requirements': [
+        'license', 'certification', 'experience', 'background check',
+        'training', 'armed', 'unarmed', 'uniform', 'guard card'
+    ]
+}
+
+# Term -> category, in keyword order (terms are unique across categories)
+_KEYWORD_TO_CAT = {term: category for category, terms in _SECURITY_KEYWORDS.items() for term in terms}
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all security keywords.
+    
+    Returns:
+        ahocorasick.Automaton: Automaton yielding matched terms,
+        or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for term in _KEYWORD_TO_CAT:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Pattern ids in the scan_all database: email, phone, then one per keyword
+_SCAN_EMAIL = 0
+_SCAN_PHONE = 1
+_SCAN_KEYWORDS = tuple(enumerate(_KEYWORD_TO_CAT.items(), 2))
+
+def _build_scan_database():
+    """Build a Hyperscan database reporting which patterns occur in a text.
+    
+    Returns:
+        hyperscan.Database: Database over the email and phone patterns and
+        every security keyword, or None if hyperscan is not installed
+    """
+    if hyperscan is None:
+        return None
+    
+    expressions = [_EMAIL_RE.pattern, _PHONE_RE.pattern] + [re.escape(term) for term in _KEYWORD_TO_CAT]
+    flags = [hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * 2
+    flags += [hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_CASELESS] * len(_KEYWORD_TO_CAT)
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[expression.encode('utf-8') for expression in expressions],
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=flags
+    )
+    return database
+
+_SCAN_DATABASE = _build_scan_database()
 
 def extract_email(text):
     """Extract email addresses from text.
@@ -20,9 +140,7 @@ def extract_email(text):
     if not text:
         return []
     
-    # Regular expression for email extraction
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
 def extract_phone(text):
     """Extract phone numbers from text.
@@ -36,18 +154,7 @@ def extract_phone(text):
     if not text:
         return []
     
-    # Regular expression for US phone number formats
-    phone_patterns = [
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890, 123-456-7890, 123.456.7890
-        r'\d{3}[-.\s]?\d{4}',  # 456-7890, 456.7890
-        r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # +1 (123) 456-7890
-    ]
-    
-    results = []
-    for pattern in phone_patterns:
-        results.extend(re.findall(pattern, text))
-    
-    return results
+    return _PHONE_RE.findall(text)
 
 def normalize_company_name(name):
     """Normalize company name for matching.
@@ -65,25 +172,49 @@ def normalize_company_name(name):
     normalized = name.lower()
     
     # Remove common suffixes
-    suffixes = [
-        "inc", "inc.", "incorporated", 
-        "llc", "llc.", "l.l.c.", "limited liability company",
-        "ltd", "ltd.", "limited",
-        "corp", "corp.", "corporation",
-        "co", "co.", "company"
-    ]
-    
-    for suffix in suffixes:
-        normalized = re.sub(r'\s+' + re.escape(suffix) + r'\s*$', '', normalized)
+    for pattern in _SUFFIX_RES:
+        normalized = pattern.sub('', normalized)
     
     # Remove punctuation
-    normalized = normalized.translate(str.maketrans('', '', string.punctuation))
+    normalized = normalized.translate(_PUNCT_TABLE)
     
     # Remove extra whitespace
     normalized = ' '.join(normalized.split())
     
     return normalized
 
+# Words too common in organization names to pick duplicate candidates by
+_ORG_STOPWORDS = frozenset(['the', 'of', 'and', 'a', 'an', 'for', 'at', 'in', 'on', 'to'])
+
+def org_tokens(normalized_org):
+    """Get the words of a normalized organization name used to find duplicates.
+    
+    Args:
+        normalized_org (str): Normalized organization name
+        
+    Returns:
+        set: Distinct words, without stopwords unless the name is only stopwords
+    """
+    words = set(normalized_org.split())
+    return (words - _ORG_STOPWORDS) or words
+
+@lru_cache(maxsize=4096)
+def normalize_text(text):
+    """Normalize text for comparison (lowercase, no punctuation, single spaces).
+    
+    Args:
+        text (str): Text to normalize
+        
+    Returns:
+        str: Normalized text
+    """
+    if not text:
+        return ""
+    
+    # Lowercase, remove punctuation, and collapse whitespace; split/join is
+    # faster here than a whitespace regex substitution
+    return ' '.join(text.lower().translate(_PUNCT_TABLE).split())
+
 def is_valid_email(email):
     """Check if an email address is valid.
     
@@ -97,8 +228,7 @@ def is_valid_email(email):
         return False
     
     # Basic validation
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _VALID_EMAIL_RE.match(email):
         return False
     
     # Check for generic emails
@@ -123,7 +253,7 @@ def is_valid_phone(phone):
         return False
     
     # Remove non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     
     # Check length (7-15 digits)
     return 7 <= len(digits) <= 15
@@ -141,7 +271,7 @@ def format_phone(phone):
         return ""
     
     # Remove non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     
     # Format based on length
     if len(digits) == 10:  # US number without country code
@@ -167,105 +297,123 @@ def extract_date(text):
     if not text:
         return []
     
-    # Common date formats
-    date_patterns = [
-        r'\d{1,2}/\d{1,2}/\d{2,4}',  # MM/DD/YYYY, M/D/YY
-        r'\d{1,2}-\d{1,2}-\d{2,4}',  # MM-DD-YYYY, M-D-YY
-        r'\d{1,2}\.\d{1,2}\.\d{2,4}',  # MM.DD.YYYY, M.D.YY
-        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{2,4}'  # January 1, 2020
-    ]
-    
     results = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            try:
-                # Try different date formats
-                for fmt in ['%m/%d/%Y', '%m/%d/%y', '%m-%d-%Y', '%m-%d-%y', 
-                           '%m.%d.%Y', '%m.%d.%y', '%B %d, %Y', '%B %d %Y']:
-                    try:
-                        dt = datetime.strptime(match, fmt)
-                        results.append(dt)
-                        break
-                    except ValueError:
-                        continue
-            except Exception:
-                continue
+    for pattern, formats in _DATE_PARSERS:
+        for match in pattern.findall(text):
+            # Only the formats for the shape that matched can succeed
+            for fmt in formats:
+                try:
+                    results.append(datetime.strptime(match, fmt))
+                    break
+                except ValueError:
+                    continue
     
     return results
 
-def detect_security_keywords(text):
+def detect_security_keywords(text, lowered=False):
     """Detect security-related keywords in text.
     
     Args:
         text (str): Text to analyze
+        lowered (bool, optional): True if text is already lowercase. Defaults to False.
         
     Returns:
-        dict: Dictionary with keyword categories and matches
+        defaultdict: Keyword categories mapped to matches; missing categories
+        read as empty lists
     """
+    results = defaultdict(list)
     if not text:
-        return {}
+        return results
     
     # Convert to lowercase for case-insensitive matching
-    text_lower = text.lower()
-    
-    # Define keyword categories
-    keywords = {
-        'security_type': [
-            'armed security', 'unarmed security', 'security guard', 'security officer',
-            'security personnel', 'security staff', 'security service'
-        ],
-        'event_type': [
-            'event security', 'concert security', 'festival security', 'conference security',
-            'wedding security', 'party security', 'corporate event'
-        ],
-        'construction': [
-            'construction site', 'construction security', 'site security',
-            'building site', 'construction project'
-        ],
-        'requirements': [
-            'license', 'certification', 'experience', 'background check',
-            'training', 'armed', 'unarmed', 'uniform', 'guard card'
-        ]
-    }
+    text_lower = text if lowered else text.lower()
     
-    # Find matches
-    results = {}
-    for category, terms in keywords.items():
-        matches = []
-        for term in terms:
-            if term in text_lower:
-                matches.append(term)
-        
-        if matches:
-            results[category] = matches
+    # Find all keyword hits in a single pass when the automaton is available
+    if _KEYWORD_AUTOMATON is not None:
+        is_match = {term for _, term in _KEYWORD_AUTOMATON.iter(text_lower)}.__contains__
+    else:
+        is_match = text_lower.__contains__
+    
+    # Group matches by category, in keyword order
+    for term, category in _KEYWORD_TO_CAT.items():
+        if is_match(term):
+            results[category].append(term)
     
     return results
 
+def scan_all(text):
+    """Extract emails, phone numbers and security keywords from text.
+    
+    With hyperscan installed, one pass over the text finds which patterns
+    occur and the email and phone regexes only run when they have a hit.
+    
+    Args:
+        text (str): Text to analyze
+        
+    Returns:
+        dict: 'emails' and 'phones' lists, and 'keywords' as returned by
+        detect_security_keywords
+    """
+    if not text:
+        return {"emails": [], "phones": [], "keywords": defaultdict(list)}
+    
+    if _SCAN_DATABASE is None:
+        return {
+            # Skip the email regex when there is no '@' to anchor a match
+            "emails": extract_email(text) if '@' in text else [],
+            "phones": extract_phone(text),
+            "keywords": detect_security_keywords(text)
+        }
+    
+    hits = set()
+    _SCAN_DATABASE.scan(text.encode('utf-8'), match_event_handler=lambda pattern_id, *args: hits.add(pattern_id))
+    
+    keywords = defaultdict(list)
+    for pattern_id, (term, category) in _SCAN_KEYWORDS:
+        if pattern_id in hits:
+            keywords[category].append(term)
+    
+    return {
+        "emails": _EMAIL_RE.findall(text) if _SCAN_EMAIL in hits else [],
+        "phones": _PHONE_RE.findall(text) if _SCAN_PHONE in hits else [],
+        "keywords": keywords
+    }
+
 def calculate_confidence_score(lead_data):
     """Calculate confidence score for a lead.
     
     Args:
-        lead_data (dict): Lead data
+        lead_data (dict or models.Lead): Lead data
         
     Returns:
         float: Confidence score (0.0-1.0)
     """
+    # Read fields the same way from lead dicts and models.Lead records
+    if isinstance(lead_data, dict):
+        field = dict.get
+        organization = lead_data.get('organization', {})
+        opportunity = lead_data.get('opportunity', {})
+        contacts = lead_data.get('contacts', [])
+    else:
+        field = getattr
+        organization = lead_data.organization
+        opportunity = lead_data.opportunity
+        contacts = lead_data.contacts
+    
     score = 0.5  # Start with neutral score
     
     # Check organization name
-    if lead_data.get('organization', {}).get('name'):
+    if field(organization, 'name', None):
         score += 0.1
     
     # Check contact information
-    contacts = lead_data.get('contacts', [])
     if contacts:
         # Bonus for having contacts
         score += 0.05
         
         # Check for email and phone
-        has_email = any(contact.get('email') for contact in contacts)
-        has_phone = any(contact.get('phone') for contact in contacts)
+        has_email = any(field(contact, 'email', None) for contact in contacts)
+        has_phone = any(field(contact, 'phone', None) for contact in contacts)
         
         if has_email:
             score += 0.1
@@ -273,12 +421,11 @@ def calculate_confidence_score(lead_data):
             score += 0.1
     
     # Check opportunity details
-    opportunity = lead_data.get('opportunity', {})
-    if opportunity.get('title'):
+    if field(opportunity, 'title', None):
         score += 0.05
-    if opportunity.get('description'):
+    if field(opportunity, 'description', None):
         score += 0.05
-    if opportunity.get('location'):
+    if field(opportunity, 'location', None):
         score += 0.05
     
     # Cap at 1.0
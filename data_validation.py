@@ -6,9 +6,118 @@ to ensure quality and relevance of extracted information.
 """
 
 import re
-import string
+from collections import defaultdict
 from datetime import datetime
 
+try:
+    import ahocorasick
+except ImportError:  # Optional, fall back to substring scans
+    ahocorasick = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional, fall back to Jaccard similarity
+    fuzz = process = None
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional, Jaccard over Python sets
+    njit = None
+
+from ..utils.data_utils import calculate_confidence_score, normalize_text, org_tokens
+
+
+# Number of guards requested in an opportunity description
+_GUARD_COUNT_RE = re.compile(r'(\d+)\s+(?:guard|officer|security)', re.IGNORECASE)
+
+# Similarity above which a lead is considered a duplicate
+_DUPLICATE_THRESHOLD = 0.8
+
+# Existing-lead lists at least this long are indexed by organization word,
+# and each check only scores the leads sharing a word with its organization.
+# Organization similarity is token_set_ratio, which scores a name contained
+# in another at 100 however many words they differ by, so candidates are
+# picked by any shared word rather than by an overlap threshold
+_INDEX_MIN_LEADS = 1000
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _jaccard_hashes(words1, words2):
+        """Jaccard similarity of two sorted, de-duplicated word-hash arrays.
+        
+        Args:
+            words1 (numpy.ndarray): Sorted unique int64 word hashes
+            words2 (numpy.ndarray): Sorted unique int64 word hashes
+            
+        Returns:
+            float: Similarity score (0.0-1.0)
+        """
+        i = j = intersection = 0
+        while i < words1.shape[0] and j < words2.shape[0]:
+            if words1[i] == words2[j]:
+                intersection += 1
+                i += 1
+                j += 1
+            elif words1[i] < words2[j]:
+                i += 1
+            else:
+                j += 1
+        
+        union = words1.shape[0] + words2.shape[0] - intersection
+        if union == 0:
+            return 0.0
+        return intersection / union
+
+
+def _word_hashes(text):
+    """Hash the words of normalized text for _jaccard_hashes.
+    
+    Args:
+        text (str): Normalized text
+        
+    Returns:
+        numpy.ndarray: Sorted unique int64 word hashes
+    """
+    return np.unique(np.array([hash(word) for word in text.split()], dtype=np.int64))
+
+
+def _build_automaton(terms):
+    """Build an Aho-Corasick automaton matching any of the given terms.
+    
+    Args:
+        terms (list): Terms to match
+        
+    Returns:
+        ahocorasick.Automaton: Automaton over the terms, or None if
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_any(automaton, terms, text):
+    """Check whether text contains any of the terms.
+    
+    Args:
+        automaton (ahocorasick.Automaton): Automaton built from terms, or None
+        terms (list): Terms to match
+        text (str): Text to scan
+        
+    Returns:
+        bool: True if any term occurs in text
+    """
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(term in text for term in terms)
+
 class LeadValidator:
     """Validates and filters lead data."""
     
@@ -35,6 +144,10 @@ class LeadValidator:
             'security clearance', 'food security', 'financial security',
             'social security', 'security deposit'
         ]
+        
+        # Match each term list in a single pass over the text
+        self._security_automaton = _build_automaton(self.security_keywords)
+        self._blacklist_automaton = _build_automaton(self.blacklist_terms)
     
     def validate_lead(self, lead_data):
         """Validate a lead and determine if it should be included.
@@ -94,10 +207,10 @@ class LeadValidator:
         all_text = f"{title} {description}".lower()
         
         # Check for security keywords
-        has_security_keyword = any(keyword in all_text for keyword in self.security_keywords)
+        has_security_keyword = _contains_any(self._security_automaton, self.security_keywords, all_text)
         
         # Check for blacklisted terms
-        has_blacklist_term = any(term in all_text for term in self.blacklist_terms)
+        has_blacklist_term = _contains_any(self._blacklist_automaton, self.blacklist_terms, all_text)
         
         # If has blacklist term but no security keyword, it's likely not relevant
         if has_blacklist_term and not has_security_keyword:
@@ -181,6 +294,9 @@ class LeadDeduplicator:
         """
         self.database_manager = database_manager
         self.logger = logger
+        
+        # Without RapidFuzz, score Jaccard similarity on hashed words with Numba
+        self._use_word_hashes = fuzz is None and njit is not None
     
     def is_duplicate(self, lead_data, existing_leads=None):
         """Check if a lead is a duplicate of existing leads.
@@ -204,47 +320,83 @@ class LeadDeduplicator:
             return False, None, 0.0
         
         # Normalize organization name and title for comparison
-        normalized_org = self._normalize_text(org_name)
-        normalized_title = self._normalize_text(opp_title)
+        normalized_org = normalize_text(org_name)
+        normalized_title = normalize_text(opp_title)
         
-        # Get existing leads if not provided
+        # Get existing leads if not provided. When the database can look up
+        # likely candidates by normalized organization, it returns their
+        # stored normalized org/title directly
+        prepared = index = None
         if existing_leads is None and self.database_manager:
-            existing_leads = self.database_manager.get_all_leads()
+            if hasattr(self.database_manager, 'find_duplicate_candidates'):
+                prepared = [
+                    self._prepared_entry(*candidate)
+                    for candidate in self.database_manager.find_duplicate_candidates(normalized_org)
+                    if candidate[2] and candidate[3]
+                ]
+            else:
+                existing_leads = self.database_manager.get_all_leads()
         
-        if not existing_leads:
+        if prepared is None:
+            if not existing_leads:
+                return False, None, 0.0
+            prepared, index = self._prepare_existing(existing_leads)
+        
+        if not prepared:
             return False, None, 0.0
         
         # Check for duplicates
         highest_similarity = 0.0
         duplicate_lead_id = None
-        
-        for existing_lead in existing_leads:
+        source_url = lead_data.get('source_url')
+        
+        if index is not None:
+            candidates = set()
+            for word in org_tokens(normalized_org):
+                candidates.update(index.get(word, ()))
+            prepared = [prepared[position] for position in sorted(candidates)]
+        
+        # Score the organization against every existing lead at once; orgs
+        # too dissimilar to ever pass the threshold score 0
+        org_cutoff = (_DUPLICATE_THRESHOLD - 0.4) / 0.6
+        if process is not None and prepared:
+            org_scores = process.cdist(
+                [normalized_org], [entry[2] for entry in prepared],
+                scorer=fuzz.token_set_ratio, score_cutoff=org_cutoff * 100
+            )[0] / 100.0
+        elif self._use_word_hashes:
+            org_hashes = _word_hashes(normalized_org)
+            title_hashes = _word_hashes(normalized_title)
+            org_scores = [_jaccard_hashes(org_hashes, entry[4]) for entry in prepared]
+        else:
+            org_scores = [self._calculate_similarity(normalized_org, entry[2]) for entry in prepared]
+        
+        for entry, org_similarity in zip(prepared, org_scores):
+            lead_id, existing_url, _, normalized_existing_title, _, existing_title_hashes = entry
+            
             # Skip if same source URL
-            if existing_lead.get('source_url') == lead_data.get('source_url'):
+            if existing_url == source_url:
                 continue
             
-            # Get existing lead organization and title
-            existing_org = existing_lead.get('organization', {}).get('name', '')
-            existing_title = existing_lead.get('opportunity', {}).get('title', '')
-            
-            if not existing_org or not existing_title:
+            # Skip the title comparison if even a perfect title match could
+            # not beat the threshold or the best match so far
+            best = max(_DUPLICATE_THRESHOLD, highest_similarity)
+            if (org_similarity * 0.6) + 0.4 <= best:
                 continue
             
-            # Normalize for comparison
-            normalized_existing_org = self._normalize_text(existing_org)
-            normalized_existing_title = self._normalize_text(existing_title)
-            
-            # Calculate similarity
-            org_similarity = self._calculate_similarity(normalized_org, normalized_existing_org)
-            title_similarity = self._calculate_similarity(normalized_title, normalized_existing_title)
+            if self._use_word_hashes:
+                title_similarity = _jaccard_hashes(title_hashes, existing_title_hashes)
+            else:
+                title_cutoff = (best - org_similarity * 0.6) / 0.4
+                title_similarity = self._calculate_similarity(normalized_title, normalized_existing_title, title_cutoff)
             
             # Combined similarity score (weighted)
-            similarity = (org_similarity * 0.6) + (title_similarity * 0.4)
+            similarity = float((org_similarity * 0.6) + (title_similarity * 0.4))
             
             # Check if similarity exceeds threshold
-            if similarity > 0.8 and similarity > highest_similarity:
+            if similarity > _DUPLICATE_THRESHOLD and similarity > highest_similarity:
                 highest_similarity = similarity
-                duplicate_lead_id = existing_lead.get('id')
+                duplicate_lead_id = lead_id
         
         is_duplicate = duplicate_lead_id is not None
         
@@ -254,6 +406,64 @@ class LeadDeduplicator:
         
         return is_duplicate, duplicate_lead_id, highest_similarity
     
+    def _prepare_existing(self, existing_leads):
+        """Normalize existing leads for a duplicate check.
+        
+        Args:
+            existing_leads (list): Existing leads
+            
+        Returns:
+            tuple: (prepared, index) where prepared is a list of (id, source_url,
+            normalized_org, normalized_title, org_hashes, title_hashes) tuples
+            for leads that have both an organization name and a title (the
+            hashes are None unless Numba scoring is used), and index maps each
+            organization word to the positions in prepared of the leads using
+            it (None for small lists)
+        """
+        prepared = []
+        for existing_lead in existing_leads:
+            # Get existing lead organization and title
+            existing_org = existing_lead.get('organization', {}).get('name', '')
+            existing_title = existing_lead.get('opportunity', {}).get('title', '')
+            
+            if not existing_org or not existing_title:
+                continue
+            
+            prepared.append(self._prepared_entry(
+                existing_lead.get('id'),
+                existing_lead.get('source_url'),
+                normalize_text(existing_org),
+                normalize_text(existing_title)
+            ))
+        
+        # Index large lists so each check only scores possible matches
+        index = None
+        if len(prepared) >= _INDEX_MIN_LEADS:
+            index = defaultdict(list)
+            for position, entry in enumerate(prepared):
+                for word in org_tokens(entry[2]):
+                    index[word].append(position)
+        
+        return prepared, index
+    
+    def _prepared_entry(self, lead_id, source_url, normalized_org, normalized_title):
+        """Build the tuple is_duplicate scores an existing lead from.
+        
+        Args:
+            lead_id (str): Existing lead ID
+            source_url (str): Existing lead source URL
+            normalized_org (str): Normalized organization name
+            normalized_title (str): Normalized opportunity title
+            
+        Returns:
+            tuple: (id, source_url, normalized_org, normalized_title,
+            org_hashes, title_hashes)
+        """
+        if self._use_word_hashes:
+            return (lead_id, source_url, normalized_org, normalized_title,
+                    _word_hashes(normalized_org), _word_hashes(normalized_title))
+        return (lead_id, source_url, normalized_org, normalized_title, None, None)
+    
     def _normalize_text(self, text):
         """Normalize text for comparison.
         
@@ -263,26 +473,19 @@ class LeadDeduplicator:
         Returns:
             str: Normalized text
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        normalized = text.lower()
-        
-        # Remove punctuation
-        normalized = normalized.translate(str.maketrans('', '', string.punctuation))
-        
-        # Remove extra whitespace
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+        return normalize_text(text)
     
-    def _calculate_similarity(self, text1, text2):
+    def _calculate_similarity(self, text1, text2, score_cutoff=0.0):
         """Calculate similarity between two texts.
         
+        Uses RapidFuzz's token set ratio when available, otherwise Jaccard
+        similarity of the word sets.
+        
         Args:
             text1 (str): First text
             text2 (str): Second text
+            score_cutoff (float, optional): Scores below this may be returned
+                as 0.0 without being fully computed. Defaults to 0.0.
             
         Returns:
             float: Similarity score (0.0-1.0)
@@ -290,6 +493,9 @@ class LeadDeduplicator:
         if not text1 or not text2:
             return 0.0
         
+        if fuzz is not None:
+            return fuzz.token_set_ratio(text1, text2, score_cutoff=score_cutoff * 100) / 100.0
+        
         # Simple Jaccard similarity
         words1 = set(text1.split())
         words2 = set(text2.split())
@@ -306,6 +512,16 @@ class LeadDeduplicator:
 class LeadEnricher:
     """Enriches lead data with additional information."""
     
+    # Industry detection rules, in priority order
+    _INDUSTRY_RULES = [
+        ('Education', ('school', 'university', 'college', 'academy')),
+        ('Healthcare', ('hospital', 'medical', 'health', 'clinic')),
+        ('Government', ('government', 'city of', 'county', 'state', 'federal')),
+        ('Construction', ('construction', 'builder', 'development')),
+        ('Entertainment', ('event', 'entertainment', 'production')),
+        ('Retail', ('retail', 'store', 'shop', 'mall'))
+    ]
+    
     def __init__(self, logger=None):
         """Initialize the lead enricher.
         
@@ -313,6 +529,35 @@ class LeadEnricher:
             logger: Logger instance for logging enrichment actions
         """
         self.logger = logger
+        
+        # Map every industry term to (rule priority, industry) for a
+        # single-pass scan of organization names
+        self._industry_automaton = None
+        if ahocorasick is not None:
+            self._industry_automaton = ahocorasick.Automaton()
+            for priority, (industry, terms) in enumerate(self._INDUSTRY_RULES):
+                for term in terms:
+                    self._industry_automaton.add_word(term, (priority, industry))
+            self._industry_automaton.make_automaton()
+    
+    def _detect_industry(self, name_lower):
+        """Detect an organization's industry from its name.
+        
+        Args:
+            name_lower (str): Lowercased organization name
+            
+        Returns:
+            str: Industry of the highest-priority matching rule, or
+            'Security Services' if none match
+        """
+        if self._industry_automaton is not None:
+            match = min((value for _, value in self._industry_automaton.iter(name_lower)), default=None)
+            return match[1] if match else 'Security Services'
+        
+        for industry, terms in self._INDUSTRY_RULES:
+            if any(term in name_lower for term in terms):
+                return industry
+        return 'Security Services'
     
     def enrich_lead(self, lead_data):
         """Enrich lead data with additional information.
@@ -339,7 +584,6 @@ class LeadEnricher:
             enriched_data['contacts'] = self._enrich_contacts(enriched_data['contacts'])
         
         # Recalculate confidence score
-        from ..utils.data_utils import calculate_confidence_score
         enriched_data['confidence_score'] = calculate_confidence_score(enriched_data)
         
         return enriched_data
@@ -351,32 +595,18 @@ class LeadEnricher:
             organization (dict): Organization data to enrich
             
         Returns:
-            dict: Enriched organization data
+            dict: Enriched organization data (the original if nothing was added)
         """
-        # Make a copy to avoid modifying the original
-        enriched_org = organization.copy()
-        
         # Add industry if missing
-        if not enriched_org.get('industry') and enriched_org.get('name'):
-            # Simple industry detection based on name
-            name_lower = enriched_org['name'].lower()
+        if not organization.get('industry') and organization.get('name'):
+            # Copy only when adding a field, to avoid modifying the original
+            enriched_org = organization.copy()
             
-            if any(term in name_lower for term in ['school', 'university', 'college', 'academy']):
-                enriched_org['industry'] = 'Education'
-            elif any(term in name_lower for term in ['hospital', 'medical', 'health', 'clinic']):
-                enriched_org['industry'] = 'Healthcare'
-            elif any(term in name_lower for term in ['government', 'city of', 'county', 'state', 'federal']):
-                enriched_org['industry'] = 'Government'
-            elif any(term in name_lower for term in ['construction', 'builder', 'development']):
-                enriched_org['industry'] = 'Construction'
-            elif any(term in name_lower for term in ['event', 'entertainment', 'production']):
-                enriched_org['industry'] = 'Entertainment'
-            elif any(term in name_lower for term in ['retail', 'store', 'shop', 'mall']):
-                enriched_org['industry'] = 'Retail'
-            else:
-                enriched_org['industry'] = 'Security Services'
+            # Simple industry detection based on name
+            enriched_org['industry'] = self._detect_industry(organization['name'].lower())
+            return enriched_org
         
-        return enriched_org
+        return organization
     
     def _enrich_opportunity(self, opportunity):
         """Enrich opportunity data.
@@ -385,33 +615,34 @@ class LeadEnricher:
             opportunity (dict): Opportunity data to enrich
             
         Returns:
-            dict: Enriched opportunity data
+            dict: Enriched opportunity data (the original if nothing was added)
         """
-        # Make a copy to avoid modifying the original
-        enriched_opp = opportunity.copy()
+        updates = {}
         
         # Add guard count estimate if missing
-        if not enriched_opp.get('guard_count') and enriched_opp.get('description'):
-            description = enriched_opp['description'].lower()
-            
+        if not opportunity.get('guard_count') and opportunity.get('description'):
             # Look for numbers followed by guards/officers
-            guard_count_matches = re.findall(r'(\d+)\s+(?:guard|officer|security)', description)
-            if guard_count_matches:
+            guard_count_match = _GUARD_COUNT_RE.search(opportunity['description'])
+            if guard_count_match:
                 try:
-                    enriched_opp['guard_count'] = int(guard_count_matches[0])
+                    updates['guard_count'] = int(guard_count_match.group(1))
                 except ValueError:
                     pass
         
         # Determine if armed if not specified
-        if 'is_armed' not in enriched_opp and enriched_opp.get('description'):
-            description = enriched_opp['description'].lower()
+        if 'is_armed' not in opportunity and opportunity.get('description'):
+            description = opportunity['description'].lower()
             
             if 'armed' in description and not ('unarmed' in description):
-                enriched_opp['is_armed'] = True
+                updates['is_armed'] = True
             elif 'unarmed' in description:
-                enriched_opp['is_armed'] = False
+                updates['is_armed'] = False
         
-        return enriched_opp
+        # Copy only when adding fields, to avoid modifying the original
+        if updates:
+            return {**opportunity, **updates}
+        
+        return opportunity
     
     def _enrich_contacts(self, contacts):
         """Enrich contact data.
@@ -420,8 +651,17 @@ class LeadEnricher:
             contacts (list): Contact data to enrich
             
         Returns:
-            list: Enriched contact data
+            list: Enriched contact data (the original if no contact needs changes)
         """
+        # Nothing to do unless a contact has a phone to format or an email
+        # to infer a name from
+        if not any(
+            contact.get('phone') or
+            (contact.get('email') and not contact.get('first_name') and not contact.get('last_name'))
+            for contact in contacts
+        ):
+            return contacts
+        
         # Make a copy to avoid modifying the original
         enriched_contacts = [contact.copy() for contact in contacts]
         
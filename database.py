@@ -7,10 +7,63 @@ This module handles database operations for storing and retrieving lead data.
 import os
 import sqlite3
 import json
+import threading
+import weakref
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 import uuid
 
+from ..utils.data_utils import normalize_text, org_tokens
+
+# Maximum bound parameters per IN (...) query (SQLite's default limit is 999)
+_MAX_QUERY_PARAMS = 900
+
+_INSERT_LEAD_SQL = '''
+INSERT INTO leads (
+    id, source, source_url, date_extracted, date_updated, 
+    lead_type, status, confidence_score
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_ORGANIZATION_SQL = '''
+INSERT INTO organizations (
+    id, lead_id, name, website, industry, size, description, is_government,
+    normalized_org
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_OPPORTUNITY_SQL = '''
+INSERT INTO opportunities (
+    id, lead_id, organization_id, title, description, requirements,
+    location, opportunity_type, start_date, end_date, estimated_value,
+    is_armed, guard_count, normalized_title
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_ORG_TOKEN_SQL = 'INSERT INTO org_tokens (token, lead_id) VALUES (?, ?)'
+
+_INSERT_CONTACT_SQL = '''
+INSERT INTO contacts (
+    id, lead_id, organization_id, first_name, last_name,
+    title, email, phone, department
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SELECT_LEAD_SQL = 'SELECT * FROM leads WHERE id = ?'
+_SELECT_ORGANIZATION_SQL = 'SELECT * FROM organizations WHERE lead_id = ?'
+_SELECT_OPPORTUNITY_SQL = 'SELECT * FROM opportunities WHERE lead_id = ?'
+_SELECT_CONTACTS_SQL = 'SELECT * FROM contacts WHERE lead_id = ?'
+_SELECT_LEADS_PAGE_SQL = 'SELECT * FROM leads ORDER BY date_updated DESC LIMIT ? OFFSET ?'
+_SELECT_CANDIDATES_SQL = '''
+SELECT leads.id, leads.source_url, organizations.normalized_org, opportunities.normalized_title
+FROM leads
+JOIN organizations ON organizations.lead_id = leads.id
+JOIN opportunities ON opportunities.lead_id = leads.id
+WHERE leads.id IN (SELECT lead_id FROM org_tokens WHERE token IN ({placeholders}))
+'''
+_UPDATE_STATUS_SQL = 'UPDATE leads SET status = ?, date_updated = ? WHERE id = ?'
+
 class DatabaseManager:
     """Manages database operations for the scraper system."""
     
@@ -25,15 +78,60 @@ class DatabaseManager:
             "type": "sqlite",
             "path": str(self.base_dir / "data" / "leads.db")
         }
-        self.conn = None
+        # One connection (and cursor) per thread; WAL lets readers run
+        # alongside a writer
+        self._local = threading.local()
+        self._finalizers = []
+        self._finalizers_lock = threading.Lock()
         self._setup_database()
         
+    @property
+    def conn(self):
+        """sqlite3.Connection: This thread's database connection."""
+        return self._get_conn()
+    
+    @property
+    def cursor(self):
+        """sqlite3.Cursor: This thread's reusable cursor."""
+        self._get_conn()
+        return self._local.cursor
+    
+    def _get_conn(self):
+        """Get this thread's connection, opening it on first use.
+        
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.config["path"], check_same_thread=False)
+            
+            # WAL with synchronous=NORMAL avoids an fsync per commit; use a 64 MiB
+            # page cache, in-memory temp tables and memory-mapped reads
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            
+            # One cursor reused by every query on this thread; sqlite3's
+            # statement cache keeps the SQL below prepared between calls
+            self._local.conn = conn
+            self._local.cursor = conn.cursor()
+            
+            # Close the connection when its thread goes away, so short-lived
+            # worker threads don't each leave one open
+            finalizer = weakref.finalize(threading.current_thread(), conn.close)
+            with self._finalizers_lock:
+                self._finalizers = [f for f in self._finalizers if f.alive]
+                self._finalizers.append(finalizer)
+        return conn
+    
     def _setup_database(self):
         """Set up the database."""
         db_dir = os.path.dirname(self.config["path"])
         os.makedirs(db_dir, exist_ok=True)
         
-        self.conn = sqlite3.connect(self.config["path"])
         self._create_tables()
     
     def _create_tables(self):
@@ -65,9 +163,11 @@ class DatabaseManager:
             size TEXT,
             description TEXT,
             is_government BOOLEAN NOT NULL DEFAULT FALSE,
+            normalized_org TEXT,
             FOREIGN KEY (lead_id) REFERENCES leads(id)
         )
         ''')
+        self._add_normalized_column(cursor, 'organizations', 'normalized_org', 'name')
         
         # Create contacts table
         cursor.execute('''
@@ -102,35 +202,78 @@ class DatabaseManager:
             estimated_value REAL,
             is_armed BOOLEAN,
             guard_count INTEGER,
+            normalized_title TEXT,
             FOREIGN KEY (lead_id) REFERENCES leads(id),
             FOREIGN KEY (organization_id) REFERENCES organizations(id)
         )
         ''')
+        self._add_normalized_column(cursor, 'opportunities', 'normalized_title', 'title')
+        
+        # Index the lead_id foreign keys used by every lookup, the listing
+        # sort order, and source_url for duplicate checks
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_org_lead ON organizations(lead_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_opp_lead ON opportunities(lead_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_contact_lead ON contacts(lead_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_leads_updated ON leads(date_updated DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_leads_source_url ON leads(source_url)')
+        
+        # Words of each normalized organization name, so duplicate candidates
+        # sharing any word can be found through the index
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'org_tokens'")
+        backfill = cursor.fetchone() is None
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS org_tokens (
+            token TEXT NOT NULL,
+            lead_id TEXT NOT NULL,
+            FOREIGN KEY (lead_id) REFERENCES leads(id)
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_org_tokens ON org_tokens(token, lead_id)')
+        if backfill:
+            rows = cursor.execute('SELECT lead_id, normalized_org FROM organizations').fetchall()
+            cursor.executemany(_INSERT_ORG_TOKEN_SQL, [
+                (token, lead_id) for lead_id, normalized_org in rows
+                for token in org_tokens(normalized_org or '')
+            ])
         
         self.conn.commit()
     
-    def insert_lead(self, lead_data):
-        """Insert a new lead into the database.
+    def _add_normalized_column(self, cursor, table, column, source_column):
+        """Add and backfill a normalized text column in older databases.
+        
+        Args:
+            cursor (sqlite3.Cursor): Database cursor
+            table (str): Table name
+            column (str): Normalized column to add
+            source_column (str): Column whose text is normalized
+        """
+        columns = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+        if column in columns:
+            return
+        
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} TEXT')
+        rows = cursor.execute(f'SELECT id, {source_column} FROM {table}').fetchall()
+        cursor.executemany(
+            f'UPDATE {table} SET {column} = ? WHERE id = ?',
+            [(normalize_text(text), row_id) for row_id, text in rows]
+        )
+    
+    def _build_lead_rows(self, lead_data, now):
+        """Build the insert parameter tuples for one lead.
         
         Args:
             lead_data (dict): Lead data
+            now (str): Timestamp for date_extracted/date_updated
             
         Returns:
-            str: Lead ID
+            tuple: (lead_id, lead_row, org_row, opp_row, contact_rows, token_rows)
         """
-        cursor = self.conn.cursor()
-        
-        # Generate a unique ID for the lead
-        lead_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
+        # Generate unique IDs for the lead and its organization/opportunity
+        lead_id = uuid.uuid4().hex
+        org_id = uuid.uuid4().hex
+        opp_id = uuid.uuid4().hex
         
-        # Insert lead
-        cursor.execute('''
-        INSERT INTO leads (
-            id, source, source_url, date_extracted, date_updated, 
-            lead_type, status, confidence_score
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        lead_row = (
             lead_id,
             lead_data.get('source', ''),
             lead_data.get('source_url', ''),
@@ -139,17 +282,11 @@ class DatabaseManager:
             lead_data.get('lead_type', 'job_posting'),
             lead_data.get('status', 'new'),
             lead_data.get('confidence_score', 0.5)
-        ))
+        )
         
-        # Insert organization
         org_data = lead_data.get('organization', {})
-        org_id = str(uuid.uuid4())
-        
-        cursor.execute('''
-        INSERT INTO organizations (
-            id, lead_id, name, website, industry, size, description, is_government
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        normalized_org = normalize_text(org_data.get('name', ''))
+        org_row = (
             org_id,
             lead_id,
             org_data.get('name', ''),
@@ -157,20 +294,12 @@ class DatabaseManager:
             org_data.get('industry', ''),
             org_data.get('size', ''),
             org_data.get('description', ''),
-            org_data.get('is_government', False)
-        ))
+            org_data.get('is_government', False),
+            normalized_org
+        )
         
-        # Insert opportunity
         opp_data = lead_data.get('opportunity', {})
-        opp_id = str(uuid.uuid4())
-        
-        cursor.execute('''
-        INSERT INTO opportunities (
-            id, lead_id, organization_id, title, description, requirements,
-            location, opportunity_type, start_date, end_date, estimated_value,
-            is_armed, guard_count
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        opp_row = (
             opp_id,
             lead_id,
             org_id,
@@ -183,20 +312,13 @@ class DatabaseManager:
             opp_data.get('end_date', None),
             opp_data.get('estimated_value', None),
             opp_data.get('is_armed', False),
-            opp_data.get('guard_count', None)
-        ))
-        
-        # Insert contacts
-        contacts_data = lead_data.get('contacts', [])
-        for contact in contacts_data:
-            contact_id = str(uuid.uuid4())
-            cursor.execute('''
-            INSERT INTO contacts (
-                id, lead_id, organization_id, first_name, last_name,
-                title, email, phone, department
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                contact_id,
+            opp_data.get('guard_count', None),
+            normalize_text(opp_data.get('title', ''))
+        )
+        
+        contact_rows = [
+            (
+                uuid.uuid4().hex,
                 lead_id,
                 org_id,
                 contact.get('first_name', ''),
@@ -205,11 +327,71 @@ class DatabaseManager:
                 contact.get('email', ''),
                 contact.get('phone', ''),
                 contact.get('department', '')
-            ))
+            )
+            for contact in lead_data.get('contacts', [])
+        ]
+        
+        token_rows = [(token, lead_id) for token in org_tokens(normalized_org)]
+        
+        return lead_id, lead_row, org_row, opp_row, contact_rows, token_rows
+    
+    def insert_lead(self, lead_data):
+        """Insert a new lead into the database.
+        
+        Args:
+            lead_data (dict): Lead data
+            
+        Returns:
+            str: Lead ID
+        """
+        now = datetime.now().isoformat()
+        lead_id, lead_row, org_row, opp_row, contact_rows, token_rows = self._build_lead_rows(lead_data, now)
+        
+        # Insert the lead and its related rows in one transaction
+        with self.conn:
+            self.cursor.execute(_INSERT_LEAD_SQL, lead_row)
+            self.cursor.execute(_INSERT_ORGANIZATION_SQL, org_row)
+            self.cursor.execute(_INSERT_OPPORTUNITY_SQL, opp_row)
+            self.cursor.executemany(_INSERT_CONTACT_SQL, contact_rows)
+            self.cursor.executemany(_INSERT_ORG_TOKEN_SQL, token_rows)
         
-        self.conn.commit()
         return lead_id
     
+    def insert_leads(self, leads):
+        """Insert multiple leads in a single transaction.
+        
+        Args:
+            leads (list): Lead data dictionaries
+            
+        Returns:
+            list: Lead IDs, in input order
+        """
+        now = datetime.now().isoformat()
+        lead_ids = []
+        lead_rows = []
+        org_rows = []
+        opp_rows = []
+        contact_rows = []
+        token_rows = []
+        
+        for lead_data in leads:
+            lead_id, lead_row, org_row, opp_row, contacts, tokens = self._build_lead_rows(lead_data, now)
+            lead_ids.append(lead_id)
+            lead_rows.append(lead_row)
+            org_rows.append(org_row)
+            opp_rows.append(opp_row)
+            contact_rows.extend(contacts)
+            token_rows.extend(tokens)
+        
+        with self.conn:
+            self.cursor.executemany(_INSERT_LEAD_SQL, lead_rows)
+            self.cursor.executemany(_INSERT_ORGANIZATION_SQL, org_rows)
+            self.cursor.executemany(_INSERT_OPPORTUNITY_SQL, opp_rows)
+            self.cursor.executemany(_INSERT_CONTACT_SQL, contact_rows)
+            self.cursor.executemany(_INSERT_ORG_TOKEN_SQL, token_rows)
+        
+        return lead_ids
+    
     def get_lead(self, lead_id):
         """Get a lead by ID.
         
@@ -219,78 +401,40 @@ class DatabaseManager:
         Returns:
             dict: Lead data
         """
-        cursor = self.conn.cursor()
+        cursor = self.cursor
         
         # Get lead
-        cursor.execute('SELECT * FROM leads WHERE id = ?', (lead_id,))
+        cursor.execute(_SELECT_LEAD_SQL, (lead_id,))
         lead_row = cursor.fetchone()
         if not lead_row:
             return None
         
-        lead_data = {
-            'id': lead_row[0],
-            'source': lead_row[1],
-            'source_url': lead_row[2],
-            'date_extracted': lead_row[3],
-            'date_updated': lead_row[4],
-            'lead_type': lead_row[5],
-            'status': lead_row[6],
-            'confidence_score': lead_row[7]
-        }
+        lead_data = self._lead_from_row(lead_row)
         
         # Get organization
-        cursor.execute('SELECT * FROM organizations WHERE lead_id = ?', (lead_id,))
+        cursor.execute(_SELECT_ORGANIZATION_SQL, (lead_id,))
         org_row = cursor.fetchone()
         if org_row:
-            org_id = org_row[0]
-            lead_data['organization'] = {
-                'id': org_id,
-                'name': org_row[2],
-                'website': org_row[3],
-                'industry': org_row[4],
-                'size': org_row[5],
-                'description': org_row[6],
-                'is_government': bool(org_row[7])
-            }
+            lead_data['organization'] = self._organization_from_row(org_row)
             
             # Get opportunity
-            cursor.execute('SELECT * FROM opportunities WHERE lead_id = ?', (lead_id,))
+            cursor.execute(_SELECT_OPPORTUNITY_SQL, (lead_id,))
             opp_row = cursor.fetchone()
             if opp_row:
-                lead_data['opportunity'] = {
-                    'id': opp_row[0],
-                    'title': opp_row[3],
-                    'description': opp_row[4],
-                    'requirements': opp_row[5],
-                    'location': opp_row[6],
-                    'opportunity_type': opp_row[7],
-                    'start_date': opp_row[8],
-                    'end_date': opp_row[9],
-                    'estimated_value': opp_row[10],
-                    'is_armed': bool(opp_row[11]),
-                    'guard_count': opp_row[12]
-                }
+                lead_data['opportunity'] = self._opportunity_from_row(opp_row)
             
             # Get contacts
-            cursor.execute('SELECT * FROM contacts WHERE lead_id = ?', (lead_id,))
-            contact_rows = cursor.fetchall()
-            lead_data['contacts'] = []
-            for contact_row in contact_rows:
-                lead_data['contacts'].append({
-                    'id': contact_row[0],
-                    'first_name': contact_row[3],
-                    'last_name': contact_row[4],
-                    'title': contact_row[5],
-                    'email': contact_row[6],
-                    'phone': contact_row[7],
-                    'department': contact_row[8]
-                })
+            cursor.execute(_SELECT_CONTACTS_SQL, (lead_id,))
+            lead_data['contacts'] = [self._contact_from_row(row) for row in cursor.fetchall()]
         
         return lead_data
     
     def get_all_leads(self, limit=100, offset=0):
         """Get all leads.
         
+        Related rows are loaded with one query per table for the whole page
+        instead of per lead.
+        
         Args:
             limit (int, optional): Maximum number of leads to return. Defaults to 100.
             offset (int, optional): Offset for pagination. Defaults to 0.
@@ -298,13 +442,168 @@ class DatabaseManager:
         Returns:
             list: List of lead data
         """
-        cursor = self.conn.cursor()
+        self.cursor.execute(_SELECT_LEADS_PAGE_SQL, (limit, offset))
+        return self._assemble_leads(self.cursor.fetchall())
+    
+    def find_duplicate_candidates(self, normalized_org):
+        """Get possible duplicates of an organization by normalized name.
         
-        cursor.execute('SELECT id FROM leads ORDER BY date_updated DESC LIMIT ? OFFSET ?', 
-                      (limit, offset))
-        lead_ids = [row[0] for row in cursor.fetchall()]
+        Candidates are organizations whose normalized name shares a word with
+        this one (ignoring stopwords), found through the org_tokens index, so
+        "the acme corp" and "acme corp" or "city of austin" and "austin city"
+        are compared without scanning every lead. The stored
+        normalized organization and title are returned so they don't have
+        to be recomputed.
         
-        return [self.get_lead(lead_id) for lead_id in lead_ids]
+        Args:
+            normalized_org (str): Normalized organization name
+            
+        Returns:
+            list: (lead_id, source_url, normalized_org, normalized_title) tuples
+        """
+        if not normalized_org:
+            return []
+        
+        tokens = sorted(org_tokens(normalized_org))[:_MAX_QUERY_PARAMS]
+        placeholders = ','.join('?' * len(tokens))
+        self.cursor.execute(_SELECT_CANDIDATES_SQL.format(placeholders=placeholders), tokens)
+        return self.cursor.fetchall()
+    
+    def _assemble_leads(self, lead_rows):
+        """Build lead data for lead rows, loading related rows in bulk.
+        
+        Args:
+            lead_rows (list): Rows from the leads table
+            
+        Returns:
+            list: List of lead data, in the order of lead_rows
+        """
+        if not lead_rows:
+            return []
+        
+        lead_ids = [row[0] for row in lead_rows]
+        
+        # Bucket related rows by lead ID (column 1 in every child table),
+        # keeping the first organization/opportunity like get_lead does
+        organizations = {}
+        for row in self._select_by_lead_ids('organizations', lead_ids):
+            organizations.setdefault(row[1], row)
+        
+        opportunities = {}
+        for row in self._select_by_lead_ids('opportunities', lead_ids):
+            opportunities.setdefault(row[1], row)
+        
+        contacts = defaultdict(list)
+        for row in self._select_by_lead_ids('contacts', lead_ids):
+            contacts[row[1]].append(self._contact_from_row(row))
+        
+        leads = []
+        for lead_row in lead_rows:
+            lead_id = lead_row[0]
+            lead_data = self._lead_from_row(lead_row)
+            
+            org_row = organizations.get(lead_id)
+            if org_row:
+                lead_data['organization'] = self._organization_from_row(org_row)
+                
+                opp_row = opportunities.get(lead_id)
+                if opp_row:
+                    lead_data['opportunity'] = self._opportunity_from_row(opp_row)
+                
+                lead_data['contacts'] = contacts.get(lead_id, [])
+            
+            leads.append(lead_data)
+        
+        return leads
+    
+    def _select_by_lead_ids(self, table, lead_ids):
+        """Select all rows of a child table belonging to the given leads.
+        
+        Args:
+            table (str): Table name (organizations, opportunities or contacts)
+            lead_ids (list): Lead IDs
+            
+        Returns:
+            list: Matching rows
+        """
+        return self._select_by_ids(table, 'lead_id', lead_ids)
+    
+    def _select_by_ids(self, table, column, ids):
+        """Select all rows of a table whose column is one of the given IDs.
+        
+        Args:
+            table (str): Table name
+            column (str): ID column to filter on
+            ids (list): IDs to match
+            
+        Returns:
+            list: Matching rows
+        """
+        rows = []
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(ids), _MAX_QUERY_PARAMS):
+            chunk = ids[i:i + _MAX_QUERY_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            self.cursor.execute(f'SELECT * FROM {table} WHERE {column} IN ({placeholders})', chunk)
+            rows.extend(self.cursor.fetchall())
+        return rows
+    
+    @staticmethod
+    def _lead_from_row(lead_row):
+        """Convert a leads row to lead data."""
+        return {
+            'id': lead_row[0],
+            'source': lead_row[1],
+            'source_url': lead_row[2],
+            'date_extracted': lead_row[3],
+            'date_updated': lead_row[4],
+            'lead_type': lead_row[5],
+            'status': lead_row[6],
+            'confidence_score': lead_row[7]
+        }
+    
+    @staticmethod
+    def _organization_from_row(org_row):
+        """Convert an organizations row to organization data."""
+        return {
+            'id': org_row[0],
+            'name': org_row[2],
+            'website': org_row[3],
+            'industry': org_row[4],
+            'size': org_row[5],
+            'description': org_row[6],
+            'is_government': bool(org_row[7])
+        }
+    
+    @staticmethod
+    def _opportunity_from_row(opp_row):
+        """Convert an opportunities row to opportunity data."""
+        return {
+            'id': opp_row[0],
+            'title': opp_row[3],
+            'description': opp_row[4],
+            'requirements': opp_row[5],
+            'location': opp_row[6],
+            'opportunity_type': opp_row[7],
+            'start_date': opp_row[8],
+            'end_date': opp_row[9],
+            'estimated_value': opp_row[10],
+            'is_armed': bool(opp_row[11]),
+            'guard_count': opp_row[12]
+        }
+    
+    @staticmethod
+    def _contact_from_row(contact_row):
+        """Convert a contacts row to contact data."""
+        return {
+            'id': contact_row[0],
+            'first_name': contact_row[3],
+            'last_name': contact_row[4],
+            'title': contact_row[5],
+            'email': contact_row[6],
+            'phone': contact_row[7],
+            'department': contact_row[8]
+        }
     
     def update_lead_status(self, lead_id, status):
         """Update lead status.
@@ -316,19 +615,19 @@ class DatabaseManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        cursor = self.conn.cursor()
         now = datetime.now().isoformat()
         
         try:
-            cursor.execute('''
-            UPDATE leads SET status = ?, date_updated = ? WHERE id = ?
-            ''', (status, now, lead_id))
+            self.cursor.execute(_UPDATE_STATUS_SQL, (status, now, lead_id))
             self.conn.commit()
             return True
         except Exception:
             return False
     
     def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close the database connections of all threads."""
+        with self._finalizers_lock:
+            for finalizer in self._finalizers:
+                finalizer()
+            self._finalizers.clear()
+        self._local = threading.local()
@@ -8,18 +8,199 @@ for invitation codes.
 import os
 import sys
 import json
+import re
+import html
 import uuid
+import atexit
+import asyncio
 import smtplib
 import logging
+import weakref
 import datetime
+from functools import cached_property, lru_cache
+from email import policy
+from email.message import EmailMessage
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional fast JSON, fall back to the standard library
+    orjson = None
+
+try:
+    import jinja2
+except ImportError:  # Optional, fall back to placeholder substitution
+    jinja2 = None
+
+try:
+    import aiosmtplib
+except ImportError:  # Optional, fall back to sequential sends over smtplib
+    aiosmtplib = None
+
 # Import invitation system
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scripts.invitation_system import InvitationCodeSystem
 
+def _loads(data):
+    """Parse JSON configuration from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Live systems, whose cached SMTP connections are closed at exit. The set
+# holds them weakly so it doesn't keep discarded systems alive
+_live_systems = weakref.WeakSet()
+
+@atexit.register
+def _close_live_systems():
+    """Close the SMTP connections of systems still alive at exit."""
+    for system in list(_live_systems):
+        system.close()
+
+# {{key}} placeholders, for rendering without Jinja2
+_TOKEN_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Default email templates, written by _create_default_templates when missing
+_ADMIN_TEMPLATE_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #0d6efd; color: white; padding: 10px; text-align: center; }
+        .content { padding: 20px; background-color: #f8f9fa; }
+        .footer { text-align: center; margin-top: 20px; font-size: 12px; color: #6c757d; }
+        .button { display: inline-block; background-color: #0d6efd; color: white; padding: 10px 20px; 
+                  text-decoration: none; border-radius: 5px; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>Security Leads Automation</h2>
+        </div>
+        <div class="content">
+            <h3>New Invitation Code Confirmation</h3>
+            <p>Hello,</p>
+            <p>A new invitation code has been generated and requires your confirmation:</p>
+            <ul>
+                <li><strong>Code:</strong> {{code}}</li>
+                <li><strong>Email:</strong> {{email}}</li>
+                <li><strong>Note:</strong> {{note}}</li>
+                <li><strong>Created:</strong> {{created_at}}</li>
+                <li><strong>Expires:</strong> {{expires_at}}</li>
+            </ul>
+            <p>To confirm this invitation code, please click the button below:</p>
+            <p style="text-align: center;">
+                <a href="{{confirmation_url}}" class="button">Confirm Invitation Code</a>
+            </p>
+            <p>Or copy and paste this URL into your browser:</p>
+            <p>{{confirmation_url}}</p>
+            <p>If you did not request this invitation code, please ignore this email.</p>
+        </div>
+        <div class="footer">
+            <p>Security Leads Automation System</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_USER_TEMPLATE_HTML = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background-color: #0d6efd; color: white; padding: 10px; text-align: center; }
+        .content { padding: 20px; background-color: #f8f9fa; }
+        .footer { text-align: center; margin-top: 20px; font-size: 12px; color: #6c757d; }
+        .button { display: inline-block; background-color: #0d6efd; color: white; padding: 10px 20px; 
+                  text-decoration: none; border-radius: 5px; margin-top: 20px; }
+        .code { background-color: #e9ecef; padding: 10px; font-family: monospace; margin: 10px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>Security Leads Automation</h2>
+        </div>
+        <div class="content">
+            <h3>Your Invitation Code</h3>
+            <p>Hello,</p>
+            <p>You have been invited to use the Security Leads Automation system. Here is your invitation code:</p>
+            <div class="code">{{code}}</div>
+            <p>To access the system, please click the button below:</p>
+            <p style="text-align: center;">
+                <a href="{{deployment_url}}" class="button">Access Security Leads Automation</a>
+            </p>
+            <p>Or copy and paste this URL into your browser:</p>
+            <p>{{deployment_url}}</p>
+            <p>When prompted, enter your invitation code to gain access.</p>
+            <p>This invitation code will expire on {{expires_at}}.</p>
+        </div>
+        <div class="footer">
+            <p>Security Leads Automation System</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_DEFAULT_TEMPLATES = {
+    "admin_confirmation": _ADMIN_TEMPLATE_HTML,
+    "user_invitation": _USER_TEMPLATE_HTML
+}
+
+# Recipient placeholder in prebuilt bulk messages
+_RCPT_PLACEHOLDER = "__RCPT__"
+
+# Header line the placeholder occupies in prebuilt bulk messages
+_RCPT_HEADER = f"To: {_RCPT_PLACEHOLDER}\r\n".encode()
+
+# Errors raised when a template file does not exist
+_TEMPLATE_MISSING = (FileNotFoundError,) if jinja2 is None else (FileNotFoundError, jinja2.TemplateNotFound)
+
+def _recipient_header(to_email):
+    """Encode a To header for a single recipient.
+    
+    Args:
+        to_email (str): Recipient email address, optionally with a display name
+        
+    Returns:
+        tuple: (encoded To header line, bare address for the envelope)
+        
+    Raises:
+        ValueError: If the address is malformed, contains line breaks, lists
+            more than one recipient or has a non-ASCII local part
+    """
+    if "\r" in to_email or "\n" in to_email:
+        raise ValueError(f"Invalid recipient address: {to_email!r}")
+    
+    header = policy.SMTP.header_factory("To", to_email)
+    if header.defects or len(header.addresses) != 1:
+        raise ValueError(f"Invalid recipient address: {to_email!r}")
+    
+    return header.fold(policy=policy.SMTP).encode("ascii"), header.addresses[0].addr_spec
+
+@lru_cache(maxsize=16)
+def _read_template(path, mtime_ns):
+    """Read a template file, cached per path and modification time.
+    
+    Args:
+        path (str): Template file path
+        mtime_ns (int): File modification time; part of the cache key so
+            edited templates are re-read
+        
+    Returns:
+        str: Template source
+    """
+    return Path(path).read_text()
+
 class EmailConfirmationSystem:
     """Manages email confirmations for invitation codes."""
     
@@ -34,141 +215,101 @@ class EmailConfirmationSystem:
         self.base_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.data_dir = self.base_dir / "data"
         self.template_dir = self.base_dir / "templates" / "emails"
-        
-        # Ensure directories exist
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(self.template_dir, exist_ok=True)
+        self.template_cache_dir = self.data_dir / "template_cache"
         
         # Set up logger
         self.logger = logger or logging.getLogger(__name__)
         
-        # Load configuration
-        if not config_path:
-            config_path = str(self.base_dir / "config.json")
+        # Configuration, directories, templates and the invitation system are
+        # set up on first use so short-lived commands only pay for what they touch
+        self.config_path = config_path or str(self.base_dir / "config.json")
+        self._dirs_ready = False
         
+        # Cached SMTP connection, opened on first send and reused
+        self._smtp = None
+        _live_systems.add(self)
+    
+    @cached_property
+    def config(self):
+        """dict: Configuration loaded from config_path."""
         try:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
-            self.config = {}
-        
-        # Get email system configuration
-        self.email_config = self.config.get("email_system", {})
-        
-        # Set default values if not in config
-        self.smtp_server = self.email_config.get("smtp_server", "smtp.gmail.com")
-        self.smtp_port = self.email_config.get("smtp_port", 587)
-        self.smtp_username = self.email_config.get("smtp_username", "")
-        self.smtp_password = self.email_config.get("smtp_password", "")
-        self.from_email = self.email_config.get("from_email", "noreply@securityleads.com")
-        self.admin_email = self.email_config.get("admin_email", "admin@example.com")
-        
-        # Initialize invitation code system
-        self.invitation_system = InvitationCodeSystem(config_path, logger)
+            return {}
+    
+    @cached_property
+    def email_config(self):
+        """dict: Email system section of the configuration."""
+        return self.config.get("email_system", {})
+    
+    @cached_property
+    def smtp_server(self):
+        """str: SMTP server host."""
+        return self.email_config.get("smtp_server", "smtp.gmail.com")
+    
+    @cached_property
+    def smtp_port(self):
+        """int: SMTP server port."""
+        return self.email_config.get("smtp_port", 587)
+    
+    @cached_property
+    def smtp_username(self):
+        """str: SMTP login username."""
+        return self.email_config.get("smtp_username", "")
+    
+    @cached_property
+    def smtp_password(self):
+        """str: SMTP login password."""
+        return self.email_config.get("smtp_password", "")
+    
+    @cached_property
+    def from_email(self):
+        """str: Sender address."""
+        return self.email_config.get("from_email", "noreply@securityleads.com")
+    
+    @cached_property
+    def admin_email(self):
+        """str: Address that receives confirmation requests."""
+        return self.email_config.get("admin_email", "admin@example.com")
+    
+    @cached_property
+    def invitation_system(self):
+        """InvitationCodeSystem: Invitation code system sharing this configuration."""
+        return InvitationCodeSystem(self.config_path, self.logger)
+    
+    @cached_property
+    def _jinja_env(self):
+        """jinja2.Environment: Compiles templates once and keeps them in memory."""
+        self._ensure_dirs()
+        
+        # Bytecode is also cached on disk for warm starts across processes
+        return jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(self.template_dir)),
+            autoescape=True,
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(self.template_cache_dir))
+        )
+    
+    def _ensure_dirs(self):
+        """Create the data and template directories if they don't exist."""
+        if self._dirs_ready:
+            return
         
-        # Load email templates
-        self._create_default_templates()
+        os.makedirs(self.data_dir, exist_ok=True)
+        os.makedirs(self.template_dir, exist_ok=True)
+        os.makedirs(self.template_cache_dir, exist_ok=True)
+        self._dirs_ready = True
     
     def _create_default_templates(self):
         """Create default email templates if they don't exist."""
-        # Admin confirmation request template
-        admin_template_path = self.template_dir / "admin_confirmation.html"
-        if not os.path.exists(admin_template_path):
-            admin_template = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <style>
-                    body { font-family: Arial, sans-serif; line-height: 1.6; }
-                    .container { max-width: 600px; margin: 0 auto; padding: 20px; }
-                    .header { background-color: #0d6efd; color: white; padding: 10px; text-align: center; }
-                    .content { padding: 20px; background-color: #f8f9fa; }
-                    .footer { text-align: center; margin-top: 20px; font-size: 12px; color: #6c757d; }
-                    .button { display: inline-block; background-color: #0d6efd; color: white; padding: 10px 20px; 
-                              text-decoration: none; border-radius: 5px; margin-top: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h2>Security Leads Automation</h2>
-                    </div>
-                    <div class="content">
-                        <h3>New Invitation Code Confirmation</h3>
-                        <p>Hello,</p>
-                        <p>A new invitation code has been generated and requires your confirmation:</p>
-                        <ul>
-                            <li><strong>Code:</strong> {{code}}</li>
-                            <li><strong>Email:</strong> {{email}}</li>
-                            <li><strong>Note:</strong> {{note}}</li>
-                            <li><strong>Created:</strong> {{created_at}}</li>
-                            <li><strong>Expires:</strong> {{expires_at}}</li>
-                        </ul>
-                        <p>To confirm this invitation code, please click the button below:</p>
-                        <p style="text-align: center;">
-                            <a href="{{confirmation_url}}" class="button">Confirm Invitation Code</a>
-                        </p>
-                        <p>Or copy and paste this URL into your browser:</p>
-                        <p>{{confirmation_url}}</p>
-                        <p>If you did not request this invitation code, please ignore this email.</p>
-                    </div>
-                    <div class="footer">
-                        <p>Security Leads Automation System</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-            with open(admin_template_path, 'w') as f:
-                f.write(admin_template)
-        
-        # User invitation template
-        user_template_path = self.template_dir / "user_invitation.html"
-        if not os.path.exists(user_template_path):
-            user_template = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <style>
-                    body { font-family: Arial, sans-serif; line-height: 1.6; }
-                    .container { max-width: 600px; margin: 0 auto; padding: 20px; }
-                    .header { background-color: #0d6efd; color: white; padding: 10px; text-align: center; }
-                    .content { padding: 20px; background-color: #f8f9fa; }
-                    .footer { text-align: center; margin-top: 20px; font-size: 12px; color: #6c757d; }
-                    .button { display: inline-block; background-color: #0d6efd; color: white; padding: 10px 20px; 
-                              text-decoration: none; border-radius: 5px; margin-top: 20px; }
-                    .code { background-color: #e9ecef; padding: 10px; font-family: monospace; margin: 10px 0; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h2>Security Leads Automation</h2>
-                    </div>
-                    <div class="content">
-                        <h3>Your Invitation Code</h3>
-                        <p>Hello,</p>
-                        <p>You have been invited to use the Security Leads Automation system. Here is your invitation code:</p>
-                        <div class="code">{{code}}</div>
-                        <p>To access the system, please click the button below:</p>
-                        <p style="text-align: center;">
-                            <a href="{{deployment_url}}" class="button">Access Security Leads Automation</a>
-                        </p>
-                        <p>Or copy and paste this URL into your browser:</p>
-                        <p>{{deployment_url}}</p>
-                        <p>When prompted, enter your invitation code to gain access.</p>
-                        <p>This invitation code will expire on {{expires_at}}.</p>
-                    </div>
-                    <div class="footer">
-                        <p>Security Leads Automation System</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-            with open(user_template_path, 'w') as f:
-                f.write(user_template)
+        for template_name, template in _DEFAULT_TEMPLATES.items():
+            template_path = self.template_dir / f"{template_name}.html"
+            if not os.path.exists(template_path):
+                with open(template_path, 'w') as f:
+                    f.write(template)
     
     def _send_email(self, to_email, subject, html_content):
         """Send an email.
@@ -181,27 +322,261 @@ class EmailConfirmationSystem:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
-        # Create message
-        msg = MIMEMultipart()
+        msg = self._build_message(to_email, subject, html_content)
+        
+        try:
+            # Send over the cached connection
+            self._get_smtp().send_message(msg)
+            
+            self.logger.info(f"Sent email to {to_email}: {subject}")
+            return True
+        
+        except Exception as e:
+            # Drop the connection so the next send reconnects
+            self._reset_smtp()
+            self.logger.error(f"Error sending email to {to_email}: {str(e)}")
+            return False
+    
+    def _send_email_batch(self, messages):
+        """Send several emails back-to-back over one connection.
+        
+        When the server advertises PIPELINING (RFC 2920), MAIL FROM and
+        RCPT TO are sent together and their replies read afterwards. A
+        rejected message does not abort the batch unless more than a third
+        of the batch has failed.
+        
+        Args:
+            messages (list): (to_email, subject, html_content) tuples
+            
+        Returns:
+            list: True/False per message, in input order
+        """
+        if not messages:
+            return []
+        
+        results = [False] * len(messages)
+        max_failures = len(messages) / 3
+        failures = 0
+        
+        try:
+            server = self._get_smtp()
+            server.ehlo_or_helo_if_needed()
+        except Exception as e:
+            self._reset_smtp()
+            self.logger.error(f"Error connecting to SMTP server: {str(e)}")
+            return results
+        
+        for i, (to_email, subject, html_content) in enumerate(messages):
+            if failures > max_failures:
+                self.logger.error(f"Aborting email batch after {failures} failures")
+                break
+            
+            msg = self._build_message(to_email, subject, html_content)
+            try:
+                if server.has_extn('pipelining'):
+                    self._send_pipelined(server, to_email, msg)
+                else:
+                    server.send_message(msg)
+                
+                self.logger.info(f"Sent email to {to_email}: {subject}")
+                results[i] = True
+            
+            except Exception as e:
+                failures += 1
+                self.logger.error(f"Error sending email to {to_email}: {str(e)}")
+                
+                server = self._recover_smtp(server)
+                if server is None:
+                    break
+        
+        return results
+    
+    def send_bulk(self, recipients, subject, html_content):
+        """Send the same email to many recipients over one connection.
+        
+        The message is encoded once; each send only substitutes the
+        recipient's To header into the prebuilt bytes. Invalid addresses
+        are skipped; other failures are handled as in _send_email_batch.
+        
+        Args:
+            recipients (list): Recipient email addresses
+            subject (str): Email subject
+            html_content (str): HTML content of the email
+            
+        Returns:
+            list: True/False per recipient, in input order
+        """
+        results = [False] * len(recipients)
+        max_failures = len(recipients) / 3
+        failures = 0
+        
+        # Split around the To header so only the header block is substituted
+        prebuilt = self._build_mime_template(subject, html_content)
+        headers, separator, body = prebuilt.partition(b"\r\n\r\n")
+        before_to, _, after_to = (headers + separator).partition(_RCPT_HEADER)
+        after_to += body
+        
+        try:
+            server = self._get_smtp()
+        except Exception as e:
+            self._reset_smtp()
+            self.logger.error(f"Error connecting to SMTP server: {str(e)}")
+            return results
+        
+        for i, to_email in enumerate(recipients):
+            if failures > max_failures:
+                self.logger.error(f"Aborting bulk send after {failures} failures")
+                break
+            
+            try:
+                to_header, to_addr = _recipient_header(to_email)
+            except ValueError as e:
+                self.logger.error(f"Skipping email to {to_email!r}: {str(e)}")
+                continue
+            
+            try:
+                server.sendmail(self.from_email, to_addr, before_to + to_header + after_to)
+                
+                self.logger.info(f"Sent email to {to_email}: {subject}")
+                results[i] = True
+            
+            except Exception as e:
+                failures += 1
+                self.logger.error(f"Error sending email to {to_email}: {str(e)}")
+                
+                server = self._recover_smtp(server)
+                if server is None:
+                    break
+        
+        return results
+    
+    def _build_mime_template(self, subject, html_content):
+        """Encode an HTML email once with a placeholder recipient.
+        
+        Args:
+            subject (str): Email subject
+            html_content (str): HTML content of the email
+            
+        Returns:
+            bytes: Encoded message with CRLF line endings and a To header
+            of _RCPT_PLACEHOLDER
+        """
+        msg = EmailMessage()
         msg['From'] = self.from_email
-        msg['To'] = to_email
+        msg['To'] = _RCPT_PLACEHOLDER
         msg['Subject'] = subject
+        msg.set_content(html_content, subtype='html')
         
-        # Attach HTML content
-        msg.attach(MIMEText(html_content, 'html'))
+        return msg.as_bytes(policy=policy.SMTP)
+    
+    def _recover_smtp(self, server):
+        """Clear a failed transaction, reconnecting if the server went away.
+        
+        Args:
+            server (smtplib.SMTP): Connection the transaction failed on
+            
+        Returns:
+            smtplib.SMTP: Usable connection, or None if reconnecting failed
+        """
+        try:
+            server.rset()
+            return server
+        except (smtplib.SMTPException, OSError):
+            self._reset_smtp()
         
         try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
+            server = self._get_smtp()
+            server.ehlo_or_helo_if_needed()
+            return server
+        except Exception as e:
+            self._reset_smtp()
+            self.logger.error(f"Error reconnecting to SMTP server: {str(e)}")
+            return None
+    
+    def send_many(self, messages, connections=5):
+        """Send many emails concurrently over a small pool of SMTP connections.
+        
+        Falls back to _send_email_batch when aiosmtplib is not installed.
+        
+        Args:
+            messages (list): (to_email, subject, html_content) tuples
+            connections (int): Maximum number of concurrent SMTP connections
             
-            # Login if credentials provided
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
+        Returns:
+            list: True/False per message, in input order
+        """
+        if aiosmtplib is None or not messages:
+            return self._send_email_batch(messages)
+        
+        return asyncio.run(self._send_many_async(messages, connections))
+    
+    async def _send_many_async(self, messages, connections):
+        """Drain messages across up to `connections` aiosmtplib clients.
+        
+        Args:
+            messages (list): (to_email, subject, html_content) tuples
+            connections (int): Maximum number of concurrent SMTP connections
             
-            # Send email
-            server.send_message(msg)
-            server.quit()
+        Returns:
+            list: True/False per message, in input order
+        """
+        results = [False] * len(messages)
+        pending = iter(enumerate(messages))
+        
+        async def worker():
+            smtp = aiosmtplib.SMTP(
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                start_tls=True,
+                username=self.smtp_username or None,
+                password=self.smtp_password or None
+            )
+            try:
+                await smtp.connect()
+            except Exception as e:
+                self.logger.error(f"Error connecting to SMTP server: {str(e)}")
+                return
+            
+            try:
+                # Workers share one iterator, so each message is sent exactly once
+                for i, (to_email, subject, html_content) in pending:
+                    results[i] = await self._send_email_async(to_email, subject, html_content, smtp)
+            finally:
+                try:
+                    await smtp.quit()
+                except Exception:
+                    pass
+        
+        await asyncio.gather(*(worker() for _ in range(min(connections, len(messages)))))
+        return results
+    
+    async def _send_email_async(self, to_email, subject, html_content, smtp=None):
+        """Send an email with aiosmtplib.
+        
+        Args:
+            to_email (str): Recipient email address
+            subject (str): Email subject
+            html_content (str): HTML content of the email
+            smtp (aiosmtplib.SMTP, optional): Connected client to send over;
+                a one-off connection is used when omitted
+            
+        Returns:
+            bool: True if email sent successfully, False otherwise
+        """
+        msg = self._build_message(to_email, subject, html_content)
+        
+        try:
+            if smtp is None:
+                await aiosmtplib.send(
+                    msg,
+                    hostname=self.smtp_server,
+                    port=self.smtp_port,
+                    start_tls=True,
+                    username=self.smtp_username or None,
+                    password=self.smtp_password or None
+                )
+            else:
+                await smtp.send_message(msg)
             
             self.logger.info(f"Sent email to {to_email}: {subject}")
             return True
@@ -210,6 +585,96 @@ class EmailConfirmationSystem:
             self.logger.error(f"Error sending email to {to_email}: {str(e)}")
             return False
     
+    def _send_pipelined(self, server, to_email, msg):
+        """Send one message with MAIL FROM and RCPT TO pipelined.
+        
+        Args:
+            server (smtplib.SMTP): Connected SMTP client supporting PIPELINING
+            to_email (str): Recipient email address
+            msg (MIMEMultipart): Message to send
+        """
+        server.putcmd("mail", f"FROM:{smtplib.quoteaddr(self.from_email)}")
+        server.putcmd("rcpt", f"TO:{smtplib.quoteaddr(to_email)}")
+        
+        # Read both replies before acting on either so the stream stays in sync
+        mail_code, mail_resp = server.getreply()
+        rcpt_code, rcpt_resp = server.getreply()
+        if mail_code != 250:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, self.from_email)
+        if rcpt_code not in (250, 251):
+            raise smtplib.SMTPRecipientsRefused({to_email: (rcpt_code, rcpt_resp)})
+        
+        # smtplib sends DATA bytes as given, so encode with CRLF line endings
+        code, resp = server.data(msg.as_bytes(policy=policy.SMTP))
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
+    
+    def _build_message(self, to_email, subject, html_content):
+        """Build an HTML email message.
+        
+        Args:
+            to_email (str): Recipient email address
+            subject (str): Email subject
+            html_content (str): HTML content of the email
+            
+        Returns:
+            MIMEMultipart: Message ready to send
+        """
+        # Create message
+        msg = MIMEMultipart()
+        msg['From'] = self.from_email
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Attach HTML content
+        msg.attach(MIMEText(html_content, 'html'))
+        
+        return msg
+    
+    def _get_smtp(self):
+        """Get a live SMTP connection, connecting and logging in if needed.
+        
+        Returns:
+            smtplib.SMTP: Connected SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                # Check the cached connection is still alive
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._reset_smtp()
+        
+        # Connect to SMTP server
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        
+        # Login if credentials provided
+        if self.smtp_username and self.smtp_password:
+            server.login(self.smtp_username, self.smtp_password)
+        
+        self._smtp = server
+        return server
+    
+    def _reset_smtp(self):
+        """Discard the cached SMTP connection without a QUIT handshake."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except OSError:
+                pass
+            self._smtp = None
+    
+    def close(self):
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._reset_smtp()
+    
     def _load_template(self, template_name):
         """Load an email template.
         
@@ -217,37 +682,55 @@ class EmailConfirmationSystem:
             template_name (str): Name of the template file
             
         Returns:
-            str: Template content or None if template not found
+            jinja2.Template or str: Compiled template (template source without
+            Jinja2) or None if template not found
         """
-        template_path = self.template_dir / f"{template_name}.html"
-        
-        if not os.path.exists(template_path):
+        filename = f"{template_name}.html"
+        try:
+            try:
+                return self._get_template(filename)
+            except _TEMPLATE_MISSING:
+                # Write the defaults on first use, then look again
+                self._create_default_templates()
+                return self._get_template(filename)
+        except _TEMPLATE_MISSING:
             self.logger.error(f"Email template not found: {template_name}")
             return None
-        
-        try:
-            with open(template_path, 'r') as f:
-                return f.read()
         except Exception as e:
             self.logger.error(f"Error loading email template {template_name}: {str(e)}")
             return None
     
+    def _get_template(self, filename):
+        """Get a template from the Jinja2 environment, or its source without Jinja2.
+        
+        Args:
+            filename (str): Template file name
+            
+        Returns:
+            jinja2.Template or str: Compiled template or template source
+        """
+        if jinja2 is None:
+            self._ensure_dirs()
+            path = self.template_dir / filename
+            return _read_template(str(path), os.stat(path).st_mtime_ns)
+        
+        return self._jinja_env.get_template(filename)
+    
     def _render_template(self, template, context):
         """Render an email template with context variables.
         
         Args:
-            template (str): Template content
+            template (jinja2.Template or str): Compiled template or template source
             context (dict): Context variables
             
         Returns:
             str: Rendered template
         """
-        # Simple template rendering
-        rendered = template
-        for key, value in context.items():
-            rendered = rendered.replace(f"{{{{{key}}}}}", str(value))
+        if isinstance(template, str):
+            # Substitute every placeholder in one pass, escaped like Jinja2's autoescape
+            return _TOKEN_RE.sub(lambda m: html.escape(str(context.get(m.group(1), ''))), template)
         
-        return rendered
+        return template.render(**context)
     
     def request_admin_confirmation(self, code):
         """Send an email to the admin to confirm an invitation code.
@@ -299,27 +782,69 @@ class EmailConfirmationSystem:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        message = self._invitation_message(code)
+        if not message:
+            return False
+        
+        # Send email
+        return self._send_email(*message)
+    
+    def send_invitation_emails(self, codes):
+        """Send invitation emails for several codes over one SMTP connection.
+        
+        Args:
+            codes (list): Invitation codes
+            
+        Returns:
+            dict: Code mapped to True if its email was sent, False otherwise
+        """
+        results = dict.fromkeys(codes, False)
+        
+        # Codes that fail the guard checks are skipped, the rest go out as one batch
+        pending = []
+        for code in results:
+            message = self._invitation_message(code)
+            if message:
+                pending.append((code, message))
+        
+        sent = self._send_email_batch([message for _, message in pending])
+        for (code, _), success in zip(pending, sent):
+            results[code] = success
+        
+        return results
+    
+    def _invitation_message(self, code):
+        """Build the invitation email for a confirmed, active code.
+        
+        Args:
+            code (str): The invitation code
+            
+        Returns:
+            tuple: (to_email, subject, html_content), or None if the code is
+            unknown, has no email, is not confirmed and active, or the
+            template could not be loaded
+        """
         # Get code information
         code_info = self.invitation_system.get_code_info(code)
         if not code_info:
             self.logger.error(f"Invitation code not found: {code}")
-            return False
+            return None
         
         # Check if code has an associated email
         email = code_info.get("email")
         if not email:
             self.logger.error(f"No email associated with invitation code: {code}")
-            return False
+            return None
         
         # Check if code is confirmed and active
         if not code_info.get("confirmed", False) or not code_info.get("active", False):
             self.logger.error(f"Invitation code not confirmed or active: {code}")
-            return False
+            return None
         
         # Load template
         template = self._load_template("user_invitation")
         if not template:
-            return False
+            return None
         
         # Create deployment URL
         base_url = self.email_config.get("base_url", "https://whqaxvfd.manus.space")
@@ -335,9 +860,8 @@ class EmailConfirmationSystem:
         # Render template
         html_content = self._render_template(template, context)
         
-        # Send email
         subject = "Your Security Leads Automation Invitation"
-        return self._send_email(email, subject, html_content)
+        return email, subject, html_content
     
     def generate_and_request_confirmation(self, email=None, note=None):
         """Generate a new invitation code and request admin confirmation.
@@ -385,6 +909,20 @@ class EmailConfirmationSystem:
         return True
 
 
+def ensure_templates(config_path=None, logger=None):
+    """Write any missing default email templates.
+    
+    Run once at install time so sends never take the template bootstrap path.
+    
+    Args:
+        config_path (str, optional): Path to configuration file. Defaults to None.
+        logger (Logger, optional): Logger instance. Defaults to None.
+    """
+    email_system = EmailConfirmationSystem(config_path, logger)
+    email_system._ensure_dirs()
+    email_system._create_default_templates()
+
+
 # Command-line interface
 if __name__ == "__main__":
     # Set up logging
@@ -5,6 +5,10 @@
 
 echo "Installing Security Leads Automation System..."
 
+# Run from the project root, where requirements.txt and the scripts package live
+BASE_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "$BASE_DIR"
+
 # Check if Python is installed
 if ! command -v python3 &> /dev/null; then
     echo "Error: Python 3 is required but not installed."
@@ -14,12 +18,22 @@ fi
 
 # Install required packages
 echo "Installing required Python packages..."
-pip install requests beautifulsoup4 selenium pandas lxml schedule
+if ! pip install -r requirements.txt; then
+    echo "Error: Failed to install the packages in requirements.txt."
+    exit 1
+fi
 
 # Create necessary directories
 echo "Setting up directory structure..."
 mkdir -p data logs
 
+# Write default email templates
+echo "Writing default email templates..."
+if ! python3 -c "from scripts.email_confirmation import ensure_templates; ensure_templates()"; then
+    echo "Error: Failed to write the default email templates."
+    exit 1
+fi
+
 # Set permissions
 echo "Setting file permissions..."
 chmod +x run.sh
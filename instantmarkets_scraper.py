@@ -5,8 +5,38 @@ This module implements a scraper for InstantMarkets, extracting security service
 """
 
 import re
+from datetime import timedelta
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import SoupStrainer
 from ..core.base_scraper import BaseScraper
-from ..utils.data_utils import extract_email, extract_phone, extract_date, detect_security_keywords, calculate_confidence_score
+from ..utils.data_utils import scan_all, calculate_confidence_score
+
+# Pre-compiled case-insensitive class matchers
+_OPPORTUNITY_RE = re.compile("opportunity", re.I)
+_RFP_RE = re.compile("rfp|bid", re.I)
+_TITLE_RE = re.compile("title", re.I)
+_AGENCY_RE = re.compile("agency", re.I)
+_DUE_RE = re.compile("due", re.I)
+_DESCRIPTION_RE = re.compile("description|details", re.I)
+_CONTACT_RE = re.compile("contact", re.I)
+
+# Most concurrent detail page fetches per scrape; also capped by the number
+# of calls the source's rate limiter allows per window
+_DETAIL_WORKERS = 8
+
+# RFP detail pages rarely change before they expire, so keep them cached
+# longer than the listing page
+_DETAIL_CACHE_TTL = timedelta(days=7)
+
+# Agency names containing any of these are treated as government bodies
+_GOV_RE = re.compile("county|city|department|government", re.I)
+
+# Only build listing subtrees of the main page (either selector below)
+_LISTING_STRAINER = SoupStrainer("div", class_=re.compile("opportunity|rfp|bid", re.I))
+
+# Only build the description/details/contact subtrees of detail pages
+_DETAIL_STRAINER = SoupStrainer("div", class_=re.compile("description|details|contact", re.I))
 
 class InstantmarketsScraper(BaseScraper):
     """Scraper for InstantMarkets website."""
@@ -37,65 +67,45 @@ class InstantmarketsScraper(BaseScraper):
         try:
             # Make request to the main page
             response = self._make_request(self.base_url, user_agent=user_agent)
-            soup = self._parse_html(response.text)
+            soup = self._parse_html(response.text, parse_only=_LISTING_STRAINER)
             
             # Find all RFP/contract listings
-            listings = soup.find_all("div", class_=lambda c: c and "opportunity" in c.lower())
+            listings = soup.find_all("div", class_=_OPPORTUNITY_RE)
             
             if not listings:
                 # Try alternative selectors if the above doesn't work
-                listings = soup.find_all("div", class_=lambda c: c and ("rfp" in c.lower() or "bid" in c.lower()))
+                listings = soup.find_all("div", class_=_RFP_RE)
             
             self.logger.info(f"Found {len(listings)} listings on InstantMarkets")
             
-            # Process each listing
+            # Extract basic information from each listing
+            items = []
             for listing in listings[:10]:  # Limit to first 10 for testing
                 try:
-                    # Extract basic information from listing
-                    title_elem = listing.find("a", class_=lambda c: c and "title" in c.lower()) or listing.find("h3") or listing.find("a")
-                    title = title_elem.text.strip() if title_elem else ""
-                    
-                    # Extract URL for detailed page
-                    detail_url = None
-                    if title_elem and title_elem.name == "a" and title_elem.get("href"):
-                        detail_url = title_elem["href"]
-                        if not detail_url.startswith("http"):
-                            detail_url = "https://www.instantmarkets.com" + detail_url
-                    
-                    # Extract agency/organization
-                    agency_elem = listing.find("div", class_=lambda c: c and "agency" in c.lower()) or listing.find("span", class_=lambda c: c and "agency" in c.lower())
-                    agency = agency_elem.text.strip() if agency_elem else ""
-                    
-                    # Extract due date
-                    due_date_elem = listing.find("div", class_=lambda c: c and "due" in c.lower()) or listing.find("span", class_=lambda c: c and "due" in c.lower())
-                    due_date = due_date_elem.text.strip() if due_date_elem else ""
-                    
-                    # If we have a detail URL, scrape the detailed page
-                    description = ""
-                    contact_info = ""
-                    if detail_url:
-                        try:
-                            detail_response = self._make_request(detail_url, user_agent=user_agent)
-                            detail_soup = self._parse_html(detail_response.text)
-                            
-                            # Extract description
-                            desc_elem = detail_soup.find("div", class_=lambda c: c and "description" in c.lower()) or detail_soup.find("div", class_=lambda c: c and "details" in c.lower())
-                            description = desc_elem.text.strip() if desc_elem else ""
-                            
-                            # Extract contact information
-                            contact_elem = detail_soup.find("div", class_=lambda c: c and "contact" in c.lower())
-                            contact_info = contact_elem.text.strip() if contact_elem else ""
-                        except Exception as e:
-                            self.logger.warning(f"Error scraping detail page {detail_url}: {str(e)}")
-                    
+                    items.append(self._parse_listing(listing))
+                except Exception as e:
+                    self.logger.warning(f"Error processing listing: {str(e)}")
+            
+            # Fetch detail pages concurrently over the pooled session when the
+            # rate limiter lets more than one request through at a time
+            detail_urls = [item["detail_url"] for item in items]
+            workers = min(_DETAIL_WORKERS, self.rate_limiter.max_calls)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    details = list(executor.map(self._fetch_detail, detail_urls, repeat(user_agent)))
+            else:
+                details = [self._fetch_detail(detail_url, user_agent) for detail_url in detail_urls]
+            
+            for item, (description, contact_info) in zip(items, details):
+                try:
                     # Create lead data
                     lead_data = self.extract_lead_data({
-                        "title": title,
-                        "agency": agency,
-                        "due_date": due_date,
+                        "title": item["title"],
+                        "agency": item["agency"],
+                        "due_date": item["due_date"],
                         "description": description,
                         "contact_info": contact_info,
-                        "source_url": detail_url or self.base_url
+                        "source_url": item["detail_url"] or self.base_url
                     })
                     
                     leads.append(lead_data)
@@ -107,6 +117,71 @@ class InstantmarketsScraper(BaseScraper):
             self.logger.error(f"Error scraping InstantMarkets: {str(e)}")
             return []
     
+    def _parse_listing(self, listing):
+        """Extract basic information from a listing element.
+        
+        Args:
+            listing (bs4.element.Tag): Listing element
+            
+        Returns:
+            dict: Title, agency, due date and detail URL (or None)
+        """
+        title_elem = listing.find("a", class_=_TITLE_RE) or listing.find("h3") or listing.find("a")
+        title = title_elem.text.strip() if title_elem else ""
+        
+        # Extract URL for detailed page
+        detail_url = None
+        if title_elem and title_elem.name == "a" and title_elem.get("href"):
+            detail_url = title_elem["href"]
+            if not detail_url.startswith("http"):
+                detail_url = "https://www.instantmarkets.com" + detail_url
+        
+        # Extract agency/organization
+        agency_elem = listing.find(["div", "span"], class_=_AGENCY_RE)
+        agency = agency_elem.text.strip() if agency_elem else ""
+        
+        # Extract due date
+        due_date_elem = listing.find(["div", "span"], class_=_DUE_RE)
+        due_date = due_date_elem.text.strip() if due_date_elem else ""
+        
+        return {
+            "title": title,
+            "agency": agency,
+            "due_date": due_date,
+            "detail_url": detail_url
+        }
+    
+    def _fetch_detail(self, detail_url, user_agent=None):
+        """Fetch a detail page and extract its description and contact information.
+        
+        Args:
+            detail_url (str): Detail page URL, or None
+            user_agent (str, optional): User agent string. Defaults to None.
+            
+        Returns:
+            tuple: (description, contact_info); empty strings if unavailable
+        """
+        description = ""
+        contact_info = ""
+        if not detail_url:
+            return description, contact_info
+        
+        try:
+            detail_response = self._make_request(detail_url, user_agent=user_agent, expire_after=_DETAIL_CACHE_TTL)
+            detail_soup = self._parse_html(detail_response.text, parse_only=_DETAIL_STRAINER)
+            
+            # Extract description
+            desc_elem = detail_soup.find("div", class_=_DESCRIPTION_RE)
+            description = desc_elem.text.strip() if desc_elem else ""
+            
+            # Extract contact information
+            contact_elem = detail_soup.find("div", class_=_CONTACT_RE)
+            contact_info = contact_elem.text.strip() if contact_elem else ""
+        except Exception as e:
+            self.logger.warning(f"Error scraping detail page {detail_url}: {str(e)}")
+        
+        return description, contact_info
+    
     def extract_lead_data(self, item):
         """Extract lead data from a scraped item.
         
@@ -119,34 +194,30 @@ class InstantmarketsScraper(BaseScraper):
         # Extract emails and phones from description and contact info
         description = item.get("description", "")
         contact_info = item.get("contact_info", "")
+        agency = item.get("agency", "")
         
-        all_text = f"{item.get('title', '')} {item.get('agency', '')} {description} {contact_info}"
-        
-        emails = extract_email(all_text)
-        phones = extract_phone(all_text)
+        all_text = f"{item.get('title', '')} {agency} {description} {contact_info}"
         
-        # Extract security keywords
-        keywords = detect_security_keywords(all_text)
+        # Find emails, phones and security keywords together
+        hits = scan_all(all_text)
+        emails = hits["emails"]
+        phones = hits["phones"]
+        keywords = hits["keywords"]
         
         # Determine if it's for armed or unarmed security
-        is_armed = False
-        if keywords.get('security_type'):
-            is_armed = any('armed' in keyword for keyword in keywords.get('security_type', []))
+        is_armed = any('armed' in keyword for keyword in keywords['security_type'])
         
         # Determine opportunity type
         opportunity_type = "general"
-        if keywords.get('event_type'):
+        if keywords['event_type']:
             opportunity_type = "event"
-        elif keywords.get('construction'):
+        elif keywords['construction']:
             opportunity_type = "construction"
         
         # Create organization data
         organization = {
-            "name": item.get("agency", ""),
-            "is_government": "county" in item.get("agency", "").lower() or 
-                            "city" in item.get("agency", "").lower() or 
-                            "department" in item.get("agency", "").lower() or
-                            "government" in item.get("agency", "").lower()
+            "name": agency,
+            "is_government": _GOV_RE.search(agency) is not None
         }
         
         # Create contacts
@@ -162,7 +233,7 @@ class InstantmarketsScraper(BaseScraper):
         opportunity = {
             "title": item.get("title", ""),
             "description": description,
-            "requirements": ", ".join(keywords.get('requirements', [])),
+            "requirements": ", ".join(keywords['requirements']),
             "opportunity_type": opportunity_type,
             "is_armed": is_armed,
             "end_date": item.get("due_date", "")
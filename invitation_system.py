@@ -8,12 +8,90 @@ invitation codes that control access to the system.
 import os
 import sys
 import json
-import uuid
+import mmap
+import time
+import heapq
+import struct
+import atexit
 import hashlib
+import weakref
 import datetime
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional fast JSON, fall back to the standard library
+    orjson = None
+
+
+def _dumps(obj):
+    """Serialize invitation codes as compact JSON (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Characters of a generated code (lowercase hex in the hyphenated UUID layout)
+_CODE_CHARS = "0123456789abcdef-"
+_CODE_LENGTH = 36
+
+# Snapshot index: the snapshot size it was built for, then fixed-width
+# (code, value offset, value length) entries sorted by code
+_INDEX_HEADER = struct.Struct("<Q")
+_INDEX_ENTRY = struct.Struct(f"<{_CODE_LENGTH}sQI")
+
+# Every change is written to the journal straight away. Whether the journal
+# has outgrown the snapshot is checked at most once per this many seconds,
+# unless this many changes have been journaled since the last check
+_FLUSH_INTERVAL = 1.0
+_FLUSH_MAX_PENDING = 32
+
+# The snapshot is rewritten once the journal outgrows it, but not before the
+# journal reaches this size, so a small code set isn't reloaded on every save
+_COMPACT_MIN_BYTES = 1 << 16
+
+# Live systems, whose unsaved changes are written at exit. The set holds them
+# weakly so it doesn't keep discarded systems and their journals open
+_live_systems = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_systems():
+    """Save and close the systems still alive at exit."""
+    for system in list(_live_systems):
+        system.close()
+
+
+def _expiry_epoch(code_data):
+    """Get a code's expiry time as epoch seconds."""
+    return datetime.datetime.fromisoformat(code_data["expires_at"]).timestamp()
+
+
+def _write_atomic(path, data):
+    """Replace a file's contents without leaving it half-written on a crash.
+    
+    The data is written and synced to a temporary file next to the target,
+    which is then renamed over it.
+    
+    Args:
+        path (Path): File to write
+        data (bytes): New contents
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'wb', buffering=1 << 16) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class InvitationCodeSystem:
     """Manages invitation codes for system access control."""
     
@@ -53,9 +131,46 @@ class InvitationCodeSystem:
         self.code_expiry_days = self.invitation_config.get("code_expiry_days", 7)
         self.max_uses = self.invitation_config.get("max_uses", 1)
         
-        # Load existing invitation codes
+        # Invitation codes are stored as a snapshot plus a journal of the
+        # changes made since it was written. All codes are loaded on first use
+        # of self.codes; single-code lookups read through the snapshot index
         self.codes_file = self.data_dir / "invitation_codes.json"
-        self.codes = self._load_codes()
+        self.index_file = self.data_dir / "invitation_codes.idx"
+        self.journal_file = self.data_dir / "invitation_codes.log"
+        self._codes = None
+        
+        self._snapshot_size = os.path.getsize(self.codes_file) if os.path.exists(self.codes_file) else 0
+        self.journal = self._open_journal()
+        
+        # Compaction is checked in batches; changes still pending are
+        # checked on close or exit
+        self._dirty = False
+        self._pending_changes = 0
+        self._last_flush = float("-inf")
+        _live_systems.add(self)
+    
+    @property
+    def codes(self):
+        """dict: All invitation codes, loaded on first access."""
+        if self._codes is None:
+            self._load_state()
+        return self._codes
+    
+    def _load_state(self):
+        """Load all invitation codes and build the in-memory indexes."""
+        codes = self._load_codes()
+        
+        # Expiry times as epoch seconds, parsed once instead of on every check
+        self._expiry = {code: _expiry_epoch(data) for code, data in codes.items()}
+        
+        # Indexes kept up to date by the mutating methods: active and pending
+        # codes (dicts used as ordered sets) and a min-heap of expiry times
+        self._active = {code: None for code, data in codes.items() if data["active"]}
+        self._pending = {code: None for code, data in codes.items() if not data["confirmed"]}
+        self._expiry_heap = [(expiry, code) for code, expiry in self._expiry.items()]
+        heapq.heapify(self._expiry_heap)
+        
+        self._codes = codes
     
     def _load_codes(self):
         """Load invitation codes from file.
@@ -63,24 +178,339 @@ class InvitationCodeSystem:
         Returns:
             dict: Dictionary of invitation codes
         """
+        codes = {}
         if os.path.exists(self.codes_file):
             try:
-                with open(self.codes_file, 'r') as f:
-                    return json.load(f)
+                with open(self.codes_file, 'rb') as f:
+                    codes = _loads(f.read())
             except Exception as e:
                 self.logger.error(f"Error loading invitation codes: {str(e)}")
                 return {}
-        else:
-            return {}
+        
+        # Replay changes made after the snapshot; records hold the full code
+        # data, so replaying one twice is harmless
+        for record in self._journal_records():
+            if record["op"] == "set":
+                codes[record["code"]] = record["data"]
+            elif record["op"] == "delete":
+                codes.pop(record["code"], None)
+        
+        return codes
+    
+    def _open_journal(self):
+        """Open the journal for appending.
+        
+        Returns:
+            BufferedWriter: Journal file
+        """
+        journal = open(self.journal_file, 'ab', buffering=1 << 16)
+        
+        # A crash can leave a torn last line; end it so the next record
+        # starts on a line of its own
+        if journal.tell() > 0:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    journal.write(b"\n")
+        
+        return journal
+    
+    def _journal_records(self, code=None):
+        """Read the journal's records in order, skipping unreadable lines.
+        
+        Args:
+            code (str, optional): Only read records for this code. Defaults to None.
+            
+        Yields:
+            dict: Journal record
+        """
+        needle = _dumps(code) if code is not None else None
+        try:
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    # Only parse lines that mention the code
+                    if needle is not None and needle not in line:
+                        continue
+                    if not line.strip():
+                        continue
+                    
+                    try:
+                        record = _loads(line)
+                        record_code = record["code"]
+                        record["op"]
+                    except (ValueError, KeyError, TypeError):
+                        # A torn line from a crash; the records after it are still good
+                        self.logger.warning("Skipping unreadable invitation code journal line")
+                        continue
+                    
+                    if code is None or record_code == code:
+                        yield record
+        except FileNotFoundError:
+            return
     
     def _save_codes(self):
-        """Save invitation codes to file."""
+        """Save invitation codes to file.
+        
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
         try:
-            with open(self.codes_file, 'w') as f:
-                json.dump(self.codes, f, indent=2)
+            # Serialize up front so the file gets a single write
+            payload, entries = self._serialize_snapshot()
+            _write_atomic(self.codes_file, payload)
+            self._write_index(entries, len(payload))
             self.logger.info(f"Saved {len(self.codes)} invitation codes")
+            return True
         except Exception as e:
             self.logger.error(f"Error saving invitation codes: {str(e)}")
+            return False
+    
+    def _serialize_snapshot(self):
+        """Serialize all codes as one compact JSON object.
+        
+        Returns:
+            tuple: (payload bytes, list of (code, value offset, value length))
+        """
+        parts = []
+        entries = []
+        position = 1  # after the opening brace
+        for code, data in self.codes.items():
+            if parts:
+                parts.append(b",")
+                position += 1
+            key = _dumps(code) + b":"
+            value = _dumps(data)
+            entries.append((code, position + len(key), len(value)))
+            parts.append(key)
+            parts.append(value)
+            position += len(key) + len(value)
+        
+        return b"{" + b"".join(parts) + b"}", entries
+    
+    def _write_index(self, entries, snapshot_size):
+        """Write the snapshot index, or remove it if a code can't be indexed.
+        
+        Args:
+            entries (list): (code, value offset, value length) per code
+            snapshot_size (int): Size of the snapshot the entries point into
+        """
+        if not all(len(code) == _CODE_LENGTH and code.isascii() for code, _, _ in entries):
+            # Codes from an older format; lookups fall back to a full load
+            if os.path.exists(self.index_file):
+                os.remove(self.index_file)
+            return
+        
+        entries.sort()
+        _write_atomic(self.index_file, _INDEX_HEADER.pack(snapshot_size) + b"".join(
+            _INDEX_ENTRY.pack(code.encode(), offset, length) for code, offset, length in entries
+        ))
+    
+    def _lookup(self, code):
+        """Get one code's data, without loading all codes if possible.
+        
+        Args:
+            code (str): The invitation code
+            
+        Returns:
+            dict: Code data or None if the code doesn't exist
+        """
+        if self._codes is not None or not isinstance(code, str):
+            return self.codes.get(code)
+        
+        # The journal holds the newest version of recently changed codes
+        found, data = self._journal_lookup(code)
+        if found:
+            return data
+        
+        found = self._snapshot_lookup(code)
+        if found is None:
+            # No usable index; load everything
+            return self.codes.get(code)
+        return found[1]
+    
+    def _journal_lookup(self, code):
+        """Find the latest journal record for a code.
+        
+        Args:
+            code (str): The invitation code
+            
+        Returns:
+            tuple: (found, data); data is None if the code was deleted
+        """
+        self.journal.flush()
+        
+        found, data = False, None
+        for record in self._journal_records(code):
+            found = True
+            data = record["data"] if record["op"] == "set" else None
+        
+        return found, data
+    
+    def _snapshot_lookup(self, code):
+        """Read one code from the snapshot through the index.
+        
+        The index and snapshot are memory-mapped, so only the index pages
+        touched by the binary search and the code's own bytes are read.
+        
+        Args:
+            code (str): The invitation code
+            
+        Returns:
+            tuple: (found, data), or None if there is no usable index
+        """
+        if not os.path.exists(self.codes_file):
+            return False, None
+        
+        try:
+            with open(self.index_file, 'rb') as index_f, open(self.codes_file, 'rb') as snapshot_f:
+                if os.fstat(index_f.fileno()).st_size < _INDEX_HEADER.size:
+                    return None
+                with mmap.mmap(index_f.fileno(), 0, access=mmap.ACCESS_READ) as index, \
+                        mmap.mmap(snapshot_f.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+                    # An index left over from a different snapshot is unusable
+                    if _INDEX_HEADER.unpack_from(index)[0] != len(snapshot):
+                        return None
+                    
+                    key = code.encode()
+                    lo, hi = 0, (len(index) - _INDEX_HEADER.size) // _INDEX_ENTRY.size
+                    while lo < hi:
+                        mid = (lo + hi) // 2
+                        start = _INDEX_HEADER.size + mid * _INDEX_ENTRY.size
+                        if index[start:start + _CODE_LENGTH] < key:
+                            lo = mid + 1
+                        else:
+                            hi = mid
+                    
+                    start = _INDEX_HEADER.size + lo * _INDEX_ENTRY.size
+                    if start + _INDEX_ENTRY.size <= len(index):
+                        entry_code, offset, length = _INDEX_ENTRY.unpack_from(index, start)
+                        if entry_code == key:
+                            return True, _loads(snapshot[offset:offset + length])
+                    return False, None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Error reading invitation code index: {str(e)}")
+            return None
+    
+    def _put(self, code, code_data):
+        """Store a code's data and journal the change.
+        
+        Without all codes loaded the change is only journaled; the in-memory
+        indexes are built from the journal when the codes are loaded.
+        
+        Args:
+            code (str): The invitation code
+            code_data (dict): New code data
+        """
+        if self._codes is not None:
+            self._codes[code] = code_data
+            if code not in self._expiry:
+                self._expiry[code] = _expiry_epoch(code_data)
+                heapq.heappush(self._expiry_heap, (self._expiry[code], code))
+            
+            # Keep the active/pending indexes in step with the flags
+            if code_data["active"]:
+                self._active[code] = None
+            else:
+                self._active.pop(code, None)
+            if code_data["confirmed"]:
+                self._pending.pop(code, None)
+            else:
+                self._pending[code] = None
+        
+        self._mark_dirty(code, code_data)
+    
+    def _expiry_of(self, code, code_data):
+        """Get a code's expiry time as epoch seconds.
+        
+        Args:
+            code (str): The invitation code
+            code_data (dict): The code's data
+            
+        Returns:
+            float: Expiry time
+        """
+        if self._codes is not None:
+            return self._expiry[code]
+        return _expiry_epoch(code_data)
+    
+    def _mark_dirty(self, code, code_data=None):
+        """Journal a change to a code and compact if due.
+        
+        Args:
+            code (str): The changed invitation code
+            code_data (dict, optional): New code data; None if the code was removed.
+                Defaults to None.
+        """
+        if code_data is None:
+            record = {"op": "delete", "code": code}
+        else:
+            record = {"op": "set", "code": code, "data": code_data}
+        self.journal.write(_dumps(record) + b"\n")
+        
+        # Other processes and instances read the journal, so the change is
+        # written out now rather than left in the buffer
+        try:
+            self.journal.flush()
+        except Exception as e:
+            self.logger.error(f"Error writing invitation code journal: {str(e)}")
+        
+        self._dirty = True
+        self._pending_changes += 1
+        self.flush()
+    
+    def flush(self, force=False):
+        """Write journaled changes to disk and compact if due.
+        
+        The snapshot is rewritten once the journal outgrows it. The check is
+        skipped until the flush interval has passed or enough changes are
+        pending.
+        
+        Args:
+            force (bool, optional): Check now instead of waiting for the flush
+                interval or pending-change threshold. Defaults to False.
+        """
+        if not self._dirty:
+            return
+        
+        if not force and (time.monotonic() - self._last_flush < _FLUSH_INTERVAL
+                          and self._pending_changes < _FLUSH_MAX_PENDING):
+            return
+        
+        try:
+            self.journal.flush()
+        except Exception as e:
+            self.logger.error(f"Error writing invitation code journal: {str(e)}")
+            return
+        
+        if self.journal.tell() > max(self._snapshot_size, _COMPACT_MIN_BYTES):
+            self.compact()
+        
+        self._dirty = False
+        self._pending_changes = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Write any unsaved changes and close the journal."""
+        if self.journal.closed:
+            return
+        
+        self.flush(force=True)
+        self.journal.close()
+        _live_systems.discard(self)
+    
+    def compact(self):
+        """Rewrite the snapshot from memory and empty the journal."""
+        self.journal.flush()
+        
+        # The journal is only emptied once the snapshot holding its changes is saved
+        if not self._save_codes():
+            return
+        
+        self._snapshot_size = os.path.getsize(self.codes_file)
+        self.journal.seek(0)
+        self.journal.truncate()
     
     def generate_code(self, email=None, note=None):
         """Generate a new invitation code.
@@ -92,12 +522,15 @@ class InvitationCodeSystem:
         Returns:
             str: The generated invitation code
         """
-        # Generate a unique code
-        code = str(uuid.uuid4())
+        # Generate a unique code: 128 random bits in the hyphenated UUID layout
+        # existing codes use
+        h = os.urandom(16).hex()
+        code = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
         
         # Create code data
-        now = datetime.datetime.now().isoformat()
-        expiry = (datetime.datetime.now() + datetime.timedelta(days=self.code_expiry_days)).isoformat()
+        now_dt = datetime.datetime.now()
+        now = now_dt.isoformat()
+        expiry = (now_dt + datetime.timedelta(days=self.code_expiry_days)).isoformat()
         
         code_data = {
             "code": code,
@@ -113,8 +546,7 @@ class InvitationCodeSystem:
         }
         
         # Save code
-        self.codes[code] = code_data
-        self._save_codes()
+        self._put(code, code_data)
         
         self.logger.info(f"Generated invitation code: {code}")
         return code
@@ -128,20 +560,18 @@ class InvitationCodeSystem:
         Returns:
             bool: True if confirmation successful, False otherwise
         """
-        if code not in self.codes:
+        code_data = self._lookup(code)
+        if code_data is None:
             self.logger.warning(f"Attempted to confirm non-existent code: {code}")
             return False
         
-        code_data = self.codes[code]
-        
         # Check if already confirmed
         if code_data["confirmed"]:
             self.logger.warning(f"Code already confirmed: {code}")
             return False
         
         # Check if expired
-        expiry = datetime.datetime.fromisoformat(code_data["expires_at"])
-        if datetime.datetime.now() > expiry:
+        if time.time() > self._expiry_of(code, code_data):
             self.logger.warning(f"Attempted to confirm expired code: {code}")
             return False
         
@@ -151,7 +581,7 @@ class InvitationCodeSystem:
         code_data["active"] = True
         
         # Save changes
-        self._save_codes()
+        self._put(code, code_data)
         
         self.logger.info(f"Confirmed invitation code: {code}")
         return True
@@ -165,34 +595,49 @@ class InvitationCodeSystem:
         Returns:
             bool: True if code is valid, False otherwise
         """
-        if code not in self.codes:
-            self.logger.warning(f"Attempted to validate non-existent code: {code}")
-            return False
+        return self._valid_code_data(code) is not None
+    
+    def _valid_code_data(self, code):
+        """Get a code's data if the code is valid.
         
-        code_data = self.codes[code]
+        Args:
+            code (str): The invitation code to validate
+            
+        Returns:
+            dict: Code data, or None if the code is invalid
+        """
+        # Reject malformed input before hashing it; strip() leaves nothing
+        # only if every character is a code character
+        if not isinstance(code, str) or len(code) != _CODE_LENGTH or code.strip(_CODE_CHARS):
+            self.logger.warning(f"Attempted to validate malformed code: {code!r}")
+            return None
+        
+        code_data = self._lookup(code)
+        if code_data is None:
+            self.logger.warning(f"Attempted to validate non-existent code: {code}")
+            return None
         
         # Check if confirmed
         if not code_data["confirmed"]:
             self.logger.warning(f"Attempted to use unconfirmed code: {code}")
-            return False
+            return None
         
         # Check if active
         if not code_data["active"]:
             self.logger.warning(f"Attempted to use inactive code: {code}")
-            return False
+            return None
         
         # Check if expired
-        expiry = datetime.datetime.fromisoformat(code_data["expires_at"])
-        if datetime.datetime.now() > expiry:
+        if time.time() > self._expiry_of(code, code_data):
             self.logger.warning(f"Attempted to use expired code: {code}")
-            return False
+            return None
         
         # Check if max uses reached
         if code_data["uses"] >= code_data["max_uses"] and code_data["max_uses"] > 0:
             self.logger.warning(f"Attempted to use code that reached max uses: {code}")
-            return False
+            return None
         
-        return True
+        return code_data
     
     def use_code(self, code):
         """Record a use of an invitation code.
@@ -203,18 +648,19 @@ class InvitationCodeSystem:
         Returns:
             bool: True if code use recorded successfully, False otherwise
         """
-        if not self.validate_code(code):
+        code_data = self._valid_code_data(code)
+        if code_data is None:
             return False
         
         # Increment uses
-        self.codes[code]["uses"] += 1
+        code_data["uses"] += 1
         
         # If max uses reached, deactivate code
-        if self.codes[code]["uses"] >= self.codes[code]["max_uses"] and self.codes[code]["max_uses"] > 0:
-            self.codes[code]["active"] = False
+        if code_data["uses"] >= code_data["max_uses"] and code_data["max_uses"] > 0:
+            code_data["active"] = False
         
         # Save changes
-        self._save_codes()
+        self._put(code, code_data)
         
         self.logger.info(f"Used invitation code: {code}")
         return True
@@ -228,15 +674,16 @@ class InvitationCodeSystem:
         Returns:
             bool: True if deactivation successful, False otherwise
         """
-        if code not in self.codes:
+        code_data = self._lookup(code)
+        if code_data is None:
             self.logger.warning(f"Attempted to deactivate non-existent code: {code}")
             return False
         
         # Deactivate code
-        self.codes[code]["active"] = False
+        code_data["active"] = False
         
         # Save changes
-        self._save_codes()
+        self._put(code, code_data)
         
         self.logger.info(f"Deactivated invitation code: {code}")
         return True
@@ -250,7 +697,7 @@ class InvitationCodeSystem:
         Returns:
             dict: Code information or None if code doesn't exist
         """
-        return self.codes.get(code)
+        return self._lookup(code)
     
     def get_all_codes(self):
         """Get all invitation codes.
@@ -260,13 +707,24 @@ class InvitationCodeSystem:
         """
         return self.codes
     
+    def dump_pretty(self):
+        """Format all invitation codes as indented JSON for inspection.
+        
+        The snapshot on disk is compact; use this to read it.
+        
+        Returns:
+            str: Indented JSON of all invitation codes
+        """
+        return json.dumps(self.codes, indent=2)
+    
     def get_active_codes(self):
         """Get all active invitation codes.
         
         Returns:
             dict: Dictionary of active invitation codes
         """
-        return {code: data for code, data in self.codes.items() if data["active"]}
+        codes = self.codes
+        return {code: codes[code] for code in self._active}
     
     def get_pending_codes(self):
         """Get all pending (unconfirmed) invitation codes.
@@ -274,7 +732,8 @@ class InvitationCodeSystem:
         Returns:
             dict: Dictionary of pending invitation codes
         """
-        return {code: data for code, data in self.codes.items() if not data["confirmed"]}
+        codes = self.codes
+        return {code: codes[code] for code in self._pending}
     
     def cleanup_expired_codes(self):
         """Remove expired invitation codes.
@@ -282,21 +741,25 @@ class InvitationCodeSystem:
         Returns:
             int: Number of codes removed
         """
-        now = datetime.datetime.now()
+        codes = self.codes
+        now = time.time()
         expired_codes = []
         
-        for code, data in self.codes.items():
-            expiry = datetime.datetime.fromisoformat(data["expires_at"])
-            if now > expiry:
+        # Only the expired entries at the top of the heap are visited
+        while self._expiry_heap and now > self._expiry_heap[0][0]:
+            _, code = heapq.heappop(self._expiry_heap)
+            if code in codes:
                 expired_codes.append(code)
         
         # Remove expired codes
         for code in expired_codes:
-            del self.codes[code]
+            del codes[code]
+            del self._expiry[code]
+            self._active.pop(code, None)
+            self._pending.pop(code, None)
+            self._mark_dirty(code)
         
-        # Save changes
         if expired_codes:
-            self._save_codes()
             self.logger.info(f"Removed {len(expired_codes)} expired invitation codes")
         
         return len(expired_codes)
@@ -348,6 +811,9 @@ if __name__ == "__main__":
     # Cleanup command
     cleanup_parser = subparsers.add_parser("cleanup", help="Remove expired invitation codes")
     
+    # Dump command
+    dump_parser = subparsers.add_parser("dump", help="Print all invitation codes as indented JSON")
+    
     args = parser.parse_args()
     
     # Execute command
@@ -406,5 +872,8 @@ if __name__ == "__main__":
         count = invitation_system.cleanup_expired_codes()
         print(f"Removed {count} expired invitation codes")
     
+    elif args.command == "dump":
+        print(invitation_system.dump_pretty())
+    
     else:
         parser.print_help()
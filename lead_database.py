@@ -14,6 +14,19 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scripts.utils.state_extraction import StateExtractor, enhance_lead_with_state_info
 
+_INSERT_LEAD_SQL = '''
+INSERT OR REPLACE INTO leads (
+    id, title, company, location, description, contact_name, 
+    contact_email, contact_phone, source, url, date_posted, 
+    date_scraped, confidence_score, status, notes, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_STATE_SQL = '''
+INSERT OR REPLACE INTO states (lead_id, state_code, state_name)
+VALUES (?, ?, ?)
+'''
+
 class LeadDatabase:
     """Database for storing and retrieving security service leads with state filtering."""
     
@@ -97,6 +110,55 @@ class LeadDatabase:
             self.logger.error(f"Error initializing database: {str(e)}")
             raise
     
+    def _prepare_lead(self, lead_data: Dict[str, Any]) -> Tuple[Dict[str, Any], tuple, List[tuple]]:
+        """Enhance a lead and build its database rows.
+        
+        Args:
+            lead_data: Lead data dictionary
+            
+        Returns:
+            Tuple of (enhanced lead, leads table row, states table rows)
+        """
+        # Generate ID if not provided
+        if 'id' not in lead_data:
+            import uuid
+            lead_data['id'] = str(uuid.uuid4())
+        
+        # Enhance lead with state information
+        enhanced_lead = enhance_lead_with_state_info(lead_data)
+        
+        # Extract states for separate storage
+        states = enhanced_lead.get('states', [])
+        
+        # Convert data to JSON
+        data_json = json.dumps(enhanced_lead)
+        
+        lead_row = (
+            enhanced_lead.get('id'),
+            enhanced_lead.get('title'),
+            enhanced_lead.get('company'),
+            enhanced_lead.get('location'),
+            enhanced_lead.get('description'),
+            enhanced_lead.get('contact_name'),
+            enhanced_lead.get('contact_email'),
+            enhanced_lead.get('contact_phone'),
+            enhanced_lead.get('source'),
+            enhanced_lead.get('url'),
+            enhanced_lead.get('date_posted'),
+            enhanced_lead.get('date_scraped'),
+            enhanced_lead.get('confidence_score'),
+            enhanced_lead.get('status', 'new'),
+            enhanced_lead.get('notes'),
+            data_json
+        )
+        
+        state_rows = [
+            (enhanced_lead.get('id'), state.get('state_code'), state.get('state_name'))
+            for state in states
+        ]
+        
+        return enhanced_lead, lead_row, state_rows
+    
     def add_lead(self, lead_data: Dict[str, Any]) -> str:
         """Add a lead to the database with state information.
         
@@ -107,65 +169,22 @@ class LeadDatabase:
             Lead ID
         """
         try:
-            # Generate ID if not provided
-            if 'id' not in lead_data:
-                import uuid
-                lead_data['id'] = str(uuid.uuid4())
-            
-            # Enhance lead with state information
-            enhanced_lead = enhance_lead_with_state_info(lead_data)
-            
-            # Extract states for separate storage
-            states = enhanced_lead.get('states', [])
-            
-            # Convert data to JSON
-            data_json = json.dumps(enhanced_lead)
+            enhanced_lead, lead_row, state_rows = self._prepare_lead(lead_data)
             
             # Connect to database
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             # Insert lead
-            cursor.execute('''
-            INSERT OR REPLACE INTO leads (
-                id, title, company, location, description, contact_name, 
-                contact_email, contact_phone, source, url, date_posted, 
-                date_scraped, confidence_score, status, notes, data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                enhanced_lead.get('id'),
-                enhanced_lead.get('title'),
-                enhanced_lead.get('company'),
-                enhanced_lead.get('location'),
-                enhanced_lead.get('description'),
-                enhanced_lead.get('contact_name'),
-                enhanced_lead.get('contact_email'),
-                enhanced_lead.get('contact_phone'),
-                enhanced_lead.get('source'),
-                enhanced_lead.get('url'),
-                enhanced_lead.get('date_posted'),
-                enhanced_lead.get('date_scraped'),
-                enhanced_lead.get('confidence_score'),
-                enhanced_lead.get('status', 'new'),
-                enhanced_lead.get('notes'),
-                data_json
-            ))
+            cursor.execute(_INSERT_LEAD_SQL, lead_row)
             
             # Insert states
-            for state in states:
-                cursor.execute('''
-                INSERT OR REPLACE INTO states (lead_id, state_code, state_name)
-                VALUES (?, ?, ?)
-                ''', (
-                    enhanced_lead.get('id'),
-                    state.get('state_code'),
-                    state.get('state_name')
-                ))
+            cursor.executemany(_INSERT_STATE_SQL, state_rows)
             
             conn.commit()
             conn.close()
             
-            self.logger.info(f"Added lead {enhanced_lead.get('id')} with {len(states)} states")
+            self.logger.info(f"Added lead {enhanced_lead.get('id')} with {len(state_rows)} states")
             
             return enhanced_lead.get('id')
         
@@ -173,6 +192,49 @@ class LeadDatabase:
             self.logger.error(f"Error adding lead: {str(e)}")
             raise
     
+    def store_leads(self, leads: List[Dict[str, Any]]) -> int:
+        """Add a batch of leads with state information in a single transaction.
+        
+        Leads that can't be prepared are logged and skipped; the rest are
+        inserted together.
+        
+        Args:
+            leads: List of lead data dictionaries
+            
+        Returns:
+            Number of leads stored
+        """
+        lead_rows = []
+        state_rows = []
+        for lead_data in leads:
+            try:
+                _, lead_row, lead_state_rows = self._prepare_lead(lead_data)
+            except Exception as e:
+                self.logger.error(f"Error preparing lead, skipping it: {str(e)}")
+                continue
+            lead_rows.append(lead_row)
+            state_rows.extend(lead_state_rows)
+        
+        if not lead_rows:
+            return 0
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                with conn:
+                    conn.executemany(_INSERT_LEAD_SQL, lead_rows)
+                    conn.executemany(_INSERT_STATE_SQL, state_rows)
+            finally:
+                conn.close()
+            
+            self.logger.info(f"Added {len(lead_rows)} leads with {len(state_rows)} states")
+            
+            return len(lead_rows)
+        
+        except Exception as e:
+            self.logger.error(f"Error adding leads: {str(e)}")
+            raise
+    
     def get_lead(self, lead_id: str) -> Optional[Dict[str, Any]]:
         """Get a lead from the database.
         
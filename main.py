@@ -66,7 +66,11 @@ class SecurityLeadsAutomation:
             
             # Initialize scraper manager
             self.logger.info("Initializing scraper manager")
-            self.scraper_manager = ScraperManager(self.config.get("scrapers", {}), self.logger)
+            self.scraper_manager = ScraperManager(
+                self.config.get("scrapers", {}),
+                self.logger,
+                config_manager=self.config_manager
+            )
             
             # Initialize data validation components
             self.logger.info("Initializing data validation components")
@@ -113,6 +117,9 @@ class SecurityLeadsAutomation:
             # Stop the scheduler
             self.scheduler.stop()
             
+            # Release the scrapers' pooled sessions
+            self.scraper_manager.close()
+            
             # Close database connection
             self.database.close()
             
@@ -0,0 +1,107 @@
+"""
+Lead Record Models for Security Leads Automation
+
+This module defines lightweight slotted record types for the lead data built
+by the scrapers, following the models described in data_models.md. Records
+are converted to plain dictionaries with to_dict() at serialization
+boundaries (scraper manager, database, exports).
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(slots=True)
+class Organization:
+    """Company/organization offering the opportunity."""
+    
+    name: str = ""
+    is_government: bool = False
+    
+    def to_dict(self):
+        """Convert the organization to a dictionary.
+        
+        Returns:
+            dict: Organization data
+        """
+        return {
+            "name": self.name,
+            "is_government": self.is_government
+        }
+
+
+@dataclass(slots=True)
+class Contact:
+    """Contact information for a lead."""
+    
+    email: str = ""
+    phone: str = ""
+    
+    def to_dict(self):
+        """Convert the contact to a dictionary.
+        
+        Returns:
+            dict: Contact data
+        """
+        return {
+            "email": self.email,
+            "phone": self.phone
+        }
+
+
+@dataclass(slots=True)
+class Opportunity:
+    """Job posting, RFP or contract details."""
+    
+    title: str = ""
+    description: str = ""
+    location: str = ""
+    requirements: str = ""
+    opportunity_type: str = "general"
+    is_armed: bool = False
+    end_date: str = ""
+    
+    def to_dict(self):
+        """Convert the opportunity to a dictionary.
+        
+        Returns:
+            dict: Opportunity data
+        """
+        return {
+            "title": self.title,
+            "description": self.description,
+            "location": self.location,
+            "requirements": self.requirements,
+            "opportunity_type": self.opportunity_type,
+            "is_armed": self.is_armed,
+            "end_date": self.end_date
+        }
+
+
+@dataclass(slots=True)
+class Lead:
+    """A lead extracted from a source."""
+    
+    source: str
+    source_url: str = ""
+    lead_type: str = ""
+    organization: Organization = field(default_factory=Organization)
+    contacts: List[Contact] = field(default_factory=list)
+    opportunity: Opportunity = field(default_factory=Opportunity)
+    confidence_score: float = 0.0
+    
+    def to_dict(self):
+        """Convert the lead and its nested records to a dictionary.
+        
+        Returns:
+            dict: Lead data in the format used by the rest of the pipeline
+        """
+        return {
+            "source": self.source,
+            "source_url": self.source_url,
+            "lead_type": self.lead_type,
+            "organization": self.organization.to_dict(),
+            "contacts": [contact.to_dict() for contact in self.contacts],
+            "opportunity": self.opportunity.to_dict(),
+            "confidence_score": self.confidence_score
+        }
@@ -16,12 +16,13 @@ from scripts.utils.state_extraction import enhance_lead_with_state_info
 class ScraperManager:
     """Manages the execution of multiple scrapers with state extraction."""
     
-    def __init__(self, config_path=None, logger=None):
+    def __init__(self, config_path=None, logger=None, config_manager=None):
         """Initialize the scraper manager.
         
         Args:
             config_path: Path to configuration file
             logger: Optional logger instance
+            config_manager: Optional ConfigManager supplying the user agent rotation
         """
         # Set up base paths
         self.base_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -46,6 +47,7 @@ class ScraperManager:
         
         # Get scraper configuration
         self.scraper_config = self.config.get("scrapers", {})
+        self.config_manager = config_manager
         
         # Initialize scrapers
         self.scrapers = self._init_scrapers()
@@ -106,43 +108,65 @@ class ScraperManager:
             # Run all scrapers
             scrapers_to_run = self.scrapers
         
-        # Run each scraper
+        # Sources are run in parallel by the automation scheduler, which
+        # calls this once per source
         for name, scraper in scrapers_to_run.items():
-            try:
-                self.logger.info(f"Running scraper: {name}")
-                
-                # Run scraper
-                leads = scraper.scrape()
-                
-                # Enhance leads with state information
-                enhanced_leads = []
-                for lead in leads:
-                    try:
-                        # Add source information
-                        lead['source'] = name
-                        
-                        # Enhance with state information
-                        enhanced_lead = enhance_lead_with_state_info(lead)
-                        
-                        enhanced_leads.append(enhanced_lead)
-                    
-                    except Exception as e:
-                        self.logger.error(f"Error enhancing lead with state information: {str(e)}")
-                        # Still include the original lead
-                        enhanced_leads.append(lead)
-                
-                self.logger.info(f"Collected {len(enhanced_leads)} leads from {name}")
-                
-                # Add to all leads
-                all_leads.extend(enhanced_leads)
-            
-            except Exception as e:
-                self.logger.error(f"Error running scraper {name}: {str(e)}")
+            all_leads.extend(self._run_one_scraper(name, scraper))
         
         self.logger.info(f"Collected {len(all_leads)} leads from {len(scrapers_to_run)} scrapers")
         
         return all_leads
     
+    def _run_one_scraper(self, name: str, scraper: Any) -> List[Dict[str, Any]]:
+        """Run a single scraper and enhance its leads with state information.
+        
+        Args:
+            name: Source name
+            scraper: Scraper instance
+            
+        Returns:
+            List of lead data dictionaries (empty on error)
+        """
+        try:
+            self.logger.info(f"Running scraper: {name}")
+            
+            # Run scraper with the next user agent in the rotation
+            user_agent = self.config_manager.next_user_agent() if self.config_manager else None
+            leads = scraper.scrape(user_agent=user_agent)
+            
+            # Enhance leads with state information
+            enhanced_leads = []
+            for lead in leads:
+                try:
+                    # Add source information
+                    lead['source'] = name
+                    
+                    # Enhance with state information
+                    enhanced_lead = enhance_lead_with_state_info(lead)
+                    
+                    enhanced_leads.append(enhanced_lead)
+                
+                except Exception as e:
+                    self.logger.error(f"Error enhancing lead with state information: {str(e)}")
+                    # Still include the original lead
+                    enhanced_leads.append(lead)
+            
+            self.logger.info(f"Collected {len(enhanced_leads)} leads from {name}")
+            
+            return enhanced_leads
+        
+        except Exception as e:
+            self.logger.error(f"Error running scraper {name}: {str(e)}")
+            return []
+    
+    def close(self) -> None:
+        """Close every scraper's pooled connections."""
+        for name, scraper in self.scrapers.items():
+            try:
+                scraper.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing scraper {name}: {str(e)}")
+    
     def get_available_sources(self) -> List[str]:
         """Get list of available scraper sources.
         
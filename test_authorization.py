@@ -2,10 +2,14 @@
 Test script for validating the authorization system
 """
 
+import gc
 import os
 import sys
 import json
+import weakref
 import logging
+import datetime
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -216,7 +220,7 @@ class TestAuthorizationSystem(unittest.TestCase):
         import datetime
         past_date = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
         code_data["expires_at"] = past_date
-        self.invitation_system._save_codes()
+        self.invitation_system._put(code, code_data)
         
         # Confirm the code
         self.invitation_system.confirm_code(code)
@@ -262,6 +266,240 @@ class TestAuthorizationSystem(unittest.TestCase):
             # Restore original method
             self.email_system._send_email = original_send_email
 
+    
+    def test_pipelined_send_uses_crlf(self):
+        """Test pipelined sends encode the message with CRLF line endings."""
+        class FakeServer:
+            def __init__(self):
+                self.sent = None
+            
+            def putcmd(self, cmd, args=""):
+                pass
+            
+            def getreply(self):
+                return 250, b"OK"
+            
+            def data(self, msg):
+                self.sent = msg
+                return 250, b"OK"
+        
+        server = FakeServer()
+        msg = self.email_system._build_message("test@example.com", "Test", "<p>Line one</p>\n<p>Line two</p>")
+        self.email_system._send_pipelined(server, "test@example.com", msg)
+        
+        # Every line ending in the DATA section is CRLF
+        self.assertIn(b"\r\n", server.sent)
+        self.assertNotIn(b"\n", server.sent.replace(b"\r\n", b""))
+
+    
+    def test_bulk_send_recipient_headers(self):
+        """Test bulk sends encode each recipient and reject header injection."""
+        class FakeServer:
+            def __init__(self):
+                self.sent = []
+            
+            def sendmail(self, from_addr, to_addrs, msg):
+                self.sent.append((to_addrs, msg))
+        
+        server = FakeServer()
+        self.email_system._get_smtp = lambda: server
+        
+        recipients = [
+            "user@example.com",
+            "user@example.com\r\nBcc: attacker@example.com",
+            "Jos\u00e9 <jose@example.com>"
+        ]
+        results = self.email_system.send_bulk(recipients, "Test", "<p>Literal __RCPT__ in the body</p>")
+        
+        # The injected address is skipped, the others are sent
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual([to for to, _ in server.sent], ["user@example.com", "jose@example.com"])
+        
+        for _, msg in server.sent:
+            headers, _, body = msg.partition(b"\r\n\r\n")
+            self.assertNotIn(b"Bcc:", headers)
+            self.assertNotIn(b"__RCPT__", headers)
+            self.assertTrue(headers.isascii())
+        
+        # The body is left untouched
+        self.assertIn(b"__RCPT__", server.sent[0][1].partition(b"\r\n\r\n")[2])
+        self.assertIn(b"To: user@example.com\r\n", server.sent[0][1])
+        self.assertIn(b"To: =?utf-8?q?Jos=C3=A9?= <jose@example.com>\r\n", server.sent[1][1])
+
+    
+    def _isolated_invitation_system(self, data_dir):
+        """Create an invitation code system that stores its codes in data_dir."""
+        system = InvitationCodeSystem(self.test_config_path, self.logger)
+        system.journal.close()
+        system.codes_file = data_dir / "invitation_codes.json"
+        system.index_file = data_dir / "invitation_codes.idx"
+        system.journal_file = data_dir / "invitation_codes.log"
+        system._snapshot_size = os.path.getsize(system.codes_file) if os.path.exists(system.codes_file) else 0
+        system.journal = system._open_journal()
+        self.addCleanup(system.journal.close)
+        return system
+    
+    def test_journal_torn_line(self):
+        """Test a torn journal line from a crash doesn't lose later codes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            
+            first = self._isolated_invitation_system(data_dir)
+            code_a = first.generate_code("a@example.com")
+            first.close()
+            
+            # Simulate a crash part way through writing a record
+            with open(data_dir / "invitation_codes.log", 'ab') as f:
+                f.write(b'{"op":"set","code":"torn')
+            
+            second = self._isolated_invitation_system(data_dir)
+            code_b = second.generate_code("b@example.com")
+            second.close()
+            
+            # Both codes survive replay and compaction
+            third = self._isolated_invitation_system(data_dir)
+            self.assertIsNotNone(third.get_code_info(code_a))
+            self.assertIsNotNone(third.get_code_info(code_b))
+            self.assertIn(code_b, third.get_all_codes())
+            third.compact()
+            third.close()
+            
+            fourth = self._isolated_invitation_system(data_dir)
+            self.assertEqual(set(fourth.get_all_codes()), {code_a, code_b})
+    
+    def test_changes_visible_to_other_instances(self):
+        """Test each change is on disk for other instances straight away."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            
+            first = self._isolated_invitation_system(data_dir)
+            code_a = first.generate_code("a@example.com")
+            code_b = first.generate_code("b@example.com")
+            first.confirm_code(code_b)
+            
+            second = self._isolated_invitation_system(data_dir)
+            self.assertIsNotNone(second.get_code_info(code_a))
+            self.assertTrue(second.validate_code(code_b))
+            self.assertEqual(set(second.get_all_codes()), {code_a, code_b})
+    
+    def test_journal_replay(self):
+        """Test changes are read back from the journal and the snapshot index."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            
+            first = self._isolated_invitation_system(data_dir)
+            code_a = first.generate_code("a@example.com")
+            code_b = first.generate_code("b@example.com")
+            first.confirm_code(code_a)
+            first.deactivate_code(code_b)
+            first.close()
+            
+            # Single-code lookups replay the journal without loading all codes
+            second = self._isolated_invitation_system(data_dir)
+            self.assertTrue(second.get_code_info(code_a)["confirmed"])
+            self.assertIsNone(second._codes)
+            self.assertEqual(set(second.get_all_codes()), {code_a, code_b})
+            self.assertEqual(set(second.get_active_codes()), {code_a})
+            self.assertEqual(set(second.get_pending_codes()), {code_b})
+            second.compact()
+            second.close()
+            
+            # After compaction lookups read the code's bytes through the index
+            third = self._isolated_invitation_system(data_dir)
+            self.assertEqual(os.path.getsize(data_dir / "invitation_codes.log"), 0)
+            self.assertTrue(third._snapshot_lookup(code_a)[0])
+            self.assertTrue(third.validate_code(code_a))
+            self.assertFalse(third.validate_code(code_b))
+            self.assertIsNone(third._codes)
+    
+    def test_index_snapshot_mismatch(self):
+        """Test an index left over from another snapshot isn't used."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            
+            first = self._isolated_invitation_system(data_dir)
+            code = first.generate_code("a@example.com")
+            first.compact()
+            first.close()
+            
+            # Rewrite the snapshot without updating its index
+            with open(data_dir / "invitation_codes.json") as f:
+                codes = json.load(f)
+            codes[code]["note"] = "edited"
+            with open(data_dir / "invitation_codes.json", 'w') as f:
+                json.dump(codes, f, indent=2)
+            
+            second = self._isolated_invitation_system(data_dir)
+            self.assertIsNone(second._snapshot_lookup(code))
+            self.assertEqual(second.get_code_info(code)["note"], "edited")
+            
+            # A missing index falls back to a full load as well
+            os.remove(data_dir / "invitation_codes.idx")
+            third = self._isolated_invitation_system(data_dir)
+            self.assertIsNone(third._snapshot_lookup(code))
+            self.assertEqual(third.get_code_info(code)["note"], "edited")
+    
+    def test_cleanup_expired_codes(self):
+        """Test cleanup removes only the expired codes at the top of the heap."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            
+            first = self._isolated_invitation_system(data_dir)
+            codes = [first.generate_code(f"{i}@example.com") for i in range(3)]
+            past = (datetime.datetime.now() - datetime.timedelta(days=1)).isoformat()
+            for code in codes[:2]:
+                code_data = first.get_code_info(code)
+                code_data["expires_at"] = past
+                first._put(code, code_data)
+            first.close()
+            
+            second = self._isolated_invitation_system(data_dir)
+            self.assertEqual(second.cleanup_expired_codes(), 2)
+            self.assertEqual(set(second.get_all_codes()), {codes[2]})
+            self.assertEqual([code for _, code in second._expiry_heap], [codes[2]])
+            self.assertEqual(second.cleanup_expired_codes(), 0)
+            second.close()
+            
+            third = self._isolated_invitation_system(data_dir)
+            self.assertIsNone(third.get_code_info(codes[0]))
+            self.assertEqual(set(third.get_all_codes()), {codes[2]})
+    
+    def test_validate_rejects_malformed_codes(self):
+        """Test malformed codes are rejected before any lookup."""
+        with tempfile.TemporaryDirectory() as tmp:
+            system = self._isolated_invitation_system(Path(tmp))
+            code = system.generate_code("a@example.com")
+            system.confirm_code(code)
+            self.assertTrue(system.validate_code(code))
+            
+            lookups = []
+            lookup = system._lookup
+            system._lookup = lambda c: lookups.append(c) or lookup(c)
+            
+            for malformed in [None, 42, "", code.upper(), code + "0", code[:-1],
+                              code[:-1] + "g", code[:-1] + " ", "\n" + code[1:]]:
+                self.assertIsNone(system._valid_code_data(malformed), repr(malformed))
+                self.assertFalse(system.validate_code(malformed))
+            
+            self.assertEqual(lookups, [])
+    
+    def test_discarded_systems_are_released(self):
+        """Test systems aren't kept alive until exit by their exit handlers."""
+        with tempfile.TemporaryDirectory() as tmp:
+            invitation_system = self._isolated_invitation_system(Path(tmp))
+            code = invitation_system.generate_code("a@example.com")
+            email_system = EmailConfirmationSystem(self.test_config_path, self.logger)
+            
+            refs = [weakref.ref(invitation_system), weakref.ref(email_system)]
+            del invitation_system, email_system
+            gc.collect()
+            
+            self.assertEqual([ref() for ref in refs], [None, None])
+            
+            # Buffered journal writes are not lost with the system
+            reloaded = self._isolated_invitation_system(Path(tmp))
+            self.assertIsNotNone(reloaded.get_code_info(code))
+
 
 if __name__ == "__main__":
     unittest.main()
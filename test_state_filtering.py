@@ -7,6 +7,7 @@ import sys
 import json
 import logging
 import unittest
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
@@ -296,6 +297,20 @@ class TestStateFiltering(unittest.TestCase):
         self.assertEqual(wa_count, 1)
         self.assertEqual(wa_leads[0]["id"], lead_id)
 
+    
+    def test_store_leads_skips_malformed_lead(self):
+        """Test a lead that can't be stored doesn't discard the rest of the batch."""
+        leads = [
+            {"id": "batch-1", "title": "Security Guard", "location": "Austin, TX", "source": "Test"},
+            {"id": "batch-2", "title": "Patrol Officer", "date_scraped": datetime.now(), "source": "Test"},
+            {"id": "batch-3", "title": "Event Security", "location": "Boise, ID", "source": "Test"}
+        ]
+        
+        self.assertEqual(self.db.store_leads(leads), 2)
+        self.assertIsNotNone(self.db.get_lead("batch-1"))
+        self.assertIsNone(self.db.get_lead("batch-2"))
+        self.assertEqual(self.db.get_lead("batch-3")["states"][0]["state_code"], "ID")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,7 @@ import os
 import sys
 import json
 import time
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -16,6 +17,9 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import SecurityLeadsAutomation
+from scripts.core.automation_scheduler import AutomationScheduler
+from scripts.core.database import DatabaseManager
+from scripts.utils.data_validation import LeadDeduplicator, LeadValidator, _INDEX_MIN_LEADS
 
 class TestSecurityLeadsAutomation(unittest.TestCase):
     """Test cases for the Security Leads Automation system."""
@@ -304,5 +308,187 @@ class TestSecurityLeadsAutomation(unittest.TestCase):
         self.system.stop()
 
 
+
+class TestAutomationScheduler(unittest.TestCase):
+    """Test cases for the automation scheduler."""
+    
+    def test_run_automation_scrapes_each_source(self):
+        """Test run_automation scrapes every source through the scraper manager."""
+        class FakeScraperManager:
+            def get_available_sources(self):
+                return ["alpha", "beta"]
+            
+            def run_scrapers(self, sources=None):
+                return [{"source": source, "title": f"{source} lead"} for source in sources]
+        
+        class FakeDatabase:
+            def __init__(self):
+                self.stored = []
+            
+            def store_leads(self, leads):
+                self.stored.extend(leads)
+                return len(leads)
+        
+        database = FakeDatabase()
+        scheduler = AutomationScheduler({}, FakeScraperManager(), database)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler._history_path = os.path.join(tmp, "run_history.jsonl")
+            scheduler.run_automation()
+        
+        run = scheduler.run_history[-1]
+        self.assertEqual(run["status"], "completed")
+        self.assertEqual(run["errors"], [])
+        self.assertEqual(run["leads_generated"], 2)
+        self.assertEqual(sorted(source["name"] for source in run["sources_processed"]), ["alpha", "beta"])
+        self.assertTrue(all(source["status"] == "success" for source in run["sources_processed"]))
+        self.assertEqual(sorted(lead["source"] for lead in database.stored), ["alpha", "beta"])
+
+    
+    def test_run_automation_records_stored_counts(self):
+        """Test each source records the leads stored, or an error if storing fails."""
+        class FakeScraperManager:
+            def get_available_sources(self):
+                return ["alpha", "beta"]
+            
+            def run_scrapers(self, sources=None):
+                return [{"source": sources[0], "title": f"lead {i}"} for i in range(3)]
+        
+        class FakeDatabase:
+            def store_leads(self, leads):
+                if leads[0]["source"] == "beta":
+                    raise RuntimeError("database is locked")
+                return len(leads) - 1
+        
+        scheduler = AutomationScheduler({}, FakeScraperManager(), FakeDatabase())
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler._history_path = os.path.join(tmp, "run_history.jsonl")
+            scheduler.run_automation()
+        
+        run = scheduler.run_history[-1]
+        self.assertEqual(run["leads_generated"], 2)
+        sources = {source["name"]: source for source in run["sources_processed"]}
+        self.assertEqual((sources["alpha"]["status"], sources["alpha"]["leads_count"]), ("success", 2))
+        self.assertEqual((sources["beta"]["status"], sources["beta"]["leads_count"]), ("error", 0))
+        self.assertEqual(len(run["errors"]), 1)
+    
+    def test_history_skips_torn_line(self):
+        """Test a torn run history line doesn't discard the other entries."""
+        scheduler = AutomationScheduler({}, None, None)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            scheduler._history_path = os.path.join(tmp, "run_history.jsonl")
+            with open(scheduler._history_path, 'w') as f:
+                f.write('{"status": "completed", "leads_generated": 3}\n')
+                f.write('{"status": "compl')
+            
+            scheduler._load_history()
+            self.assertEqual(len(scheduler.run_history), 1)
+            
+            # New entries start on a line of their own
+            scheduler.run_history.append({"status": "completed", "leads_generated": 5})
+            scheduler._save_history(scheduler.run_history[-1])
+            scheduler._load_history()
+            self.assertEqual([run["leads_generated"] for run in scheduler.run_history], [3, 5])
+
+
+class TestLeadValidator(unittest.TestCase):
+    """Test cases for the lead validator."""
+    
+    def _lead(self, title, description=""):
+        return {"opportunity": {"title": title, "description": description}}
+    
+    def test_security_keywords_match_inflected_forms(self):
+        """Test keywords match inside inflected and compound words."""
+        validator = LeadValidator()
+        fallback = LeadValidator()
+        fallback._security_automaton = fallback._blacklist_automaton = None
+        
+        for title in ["Safeguarding services", "Guards for city hall", "Mobile patrolling",
+                      "Secured parking attendants", "Alarm monitoring contract", "Night watchman"]:
+            for checker in (validator, fallback):
+                self.assertTrue(checker._is_security_related(self._lead(title)), title)
+        
+        for checker in (validator, fallback):
+            self.assertFalse(checker._is_security_related(self._lead("Landscaping services")))
+
+
+class TestLeadDeduplicator(unittest.TestCase):
+    """Test cases for the lead deduplicator."""
+    
+    def _lead(self, lead_id, org, title):
+        return {
+            "id": lead_id,
+            "source_url": f"https://example.com/{lead_id}",
+            "organization": {"name": org},
+            "opportunity": {"title": title}
+        }
+    
+    def test_existing_leads_changed_in_place(self):
+        """Test a change to the existing-leads list is seen by the next check."""
+        deduplicator = LeadDeduplicator()
+        lead = self._lead("new", "Acme Holdings", "Security guard services")
+        existing = [self._lead("a", "Globex Corporation", "Parking lot striping")]
+        
+        self.assertFalse(deduplicator.is_duplicate(lead, existing)[0])
+        
+        # Replacing an entry in place keeps the list's identity and length
+        existing[0] = self._lead("b", "Acme Holdings", "Security guard services")
+        self.assertEqual(deduplicator.is_duplicate(lead, existing)[:2], (True, "b"))
+    
+    def test_contained_organization_found_in_large_list(self):
+        """Test a duplicate is found the same way in small and indexed lists."""
+        deduplicator = LeadDeduplicator()
+        lead = self._lead("new", "Acme", "Guards")
+        duplicate = self._lead("dup", "Acme Security Services of North America",
+                               "Armed guards needed for downtown office tower")
+        filler = [self._lead(f"f{i}", f"Company {i}", f"Opening {i}")
+                  for i in range(_INDEX_MIN_LEADS)]
+        
+        for existing in ([duplicate], filler + [duplicate]):
+            self.assertEqual(deduplicator.is_duplicate(lead, existing)[:2], (True, "dup"))
+
+
+
+class TestDatabaseManager(unittest.TestCase):
+    """Test cases for the database manager."""
+    
+    def _lead(self, org, title):
+        return {
+            "source": "test",
+            "source_url": f"https://example.com/{org}/{title}",
+            "organization": {"name": org},
+            "opportunity": {"title": title}
+        }
+    
+    def test_duplicate_candidates_share_any_word(self):
+        """Test candidates are found by any shared word of the organization name."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "leads.db")
+            database = DatabaseManager({"type": "sqlite", "path": path})
+            database.insert_leads([
+                self._lead("Acme Corp", "Security guards"),
+                self._lead("Austin City", "Event security"),
+                self._lead("Globex", "Parking patrol")
+            ])
+            
+            def candidate_orgs(database, org):
+                return sorted(row[2] for row in database.find_duplicate_candidates(org))
+            
+            self.assertEqual(candidate_orgs(database, "the acme corp"), ["acme corp"])
+            self.assertEqual(candidate_orgs(database, "city of austin"), ["austin city"])
+            self.assertEqual(candidate_orgs(database, "initech"), [])
+            
+            # Databases from before the token table are backfilled on open
+            database.cursor.execute("DROP TABLE org_tokens")
+            database.conn.commit()
+            database.close()
+            
+            database = DatabaseManager({"type": "sqlite", "path": path})
+            self.assertEqual(candidate_orgs(database, "city of austin"), ["austin city"])
+            database.close()
+
+
 if __name__ == "__main__":
     unittest.main()